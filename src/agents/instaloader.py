@@ -3,6 +3,7 @@ Instaloader Agent: Handles all downloading operations using the Instaloader libr
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Union
 
@@ -14,6 +15,18 @@ from src.utils.lazy_imports import (
 from src.core.data_models import ReelItem
 
 
+@lru_cache(maxsize=None)
+def _get_http_session():
+    """
+    Returns a shared requests session for fetching media from Instagram's CDN.
+
+    Reusing one session keeps connections alive between the video and
+    thumbnail requests of a reel and across reels, instead of paying a new
+    TCP and TLS handshake for every asset.
+    """
+    return lazy_import_requests().Session()
+
+
 def download_reel(
     item: ReelItem,
     reel_number: int,
@@ -104,8 +117,7 @@ def _download_video(
         progress_callback("", 20, "Downloading video...")
         video_path = reel_folder / f"video{reel_number}.mp4"
         try:
-            requests_module = lazy_import_requests()
-            response = requests_module.get(post.video_url, stream=True, timeout=30)
+            response = _get_http_session().get(post.video_url, stream=True, timeout=30)
             response.raise_for_status()
             with open(video_path, "wb") as f:
                 for chunk in response.iter_content(chunk_size=8192):
@@ -139,8 +151,7 @@ def _download_thumbnail(
             f"Cannot find thumbnail URL on Post object; available attributes: {dir(post)}"
         )
     try:
-        requests_module = lazy_import_requests()
-        resp = requests_module.get(thumb_url, timeout=30)
+        resp = _get_http_session().get(thumb_url, timeout=30)
         resp.raise_for_status()
         with open(thumb_path, "wb") as f:
             f.write(resp.content)
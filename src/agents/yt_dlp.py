@@ -21,6 +21,9 @@ from src.utils.bin_checker import (
 from src.core.data_models import ReelItem
 from src.utils.resource_loader import get_resource_path
 
+# Parallel connections yt-dlp uses for segmented (DASH/HLS) downloads
+YT_DLP_CONCURRENT_FRAGMENTS = 4
+
 
 def download_reel(
     item: ReelItem,
@@ -83,6 +86,8 @@ def download_reel(
         "--no-warnings",
         "--retries", "3",
         "--fragment-retries", "3",
+        # Fetch DASH/HLS fragments over parallel connections
+        "--concurrent-fragments", str(YT_DLP_CONCURRENT_FRAGMENTS),
     ]
 
     startupinfo = None
@@ -17,6 +17,9 @@ except ImportError:
 from src.utils.lazy_imports import lazy_import_requests, lazy_import_moviepy
 from src.core.data_models import ReelItem
 
+# Parallel connections yt-dlp uses for segmented (DASH/HLS) downloads
+YT_DLP_CONCURRENT_FRAGMENTS = 4
+
 
 def download_reel(
     item: ReelItem,
@@ -75,6 +78,8 @@ def download_reel(
         'socket_timeout': 30,
         'retries': 5,  # More retries
         'fragment_retries': 5,
+        # Fetch DASH/HLS fragments over parallel connections
+        'concurrent_fragment_downloads': YT_DLP_CONCURRENT_FRAGMENTS,
         'sleep_interval': 1,  # Sleep between requests
         'max_sleep_interval': 3,
     }
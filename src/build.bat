@@ -4,5 +4,6 @@ pyinstaller --name "insta-downloader-gui" ^
   --windowed ^
   --icon=favicon.ico ^
   --add-data "whisper/assets;whisper/assets" ^
+  --add-data "resources/icons;resources/icons" ^
   main.py
 pause
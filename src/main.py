@@ -26,7 +26,7 @@ def main():
     Main application entry point.
 
     Initializes the PyQt6 application, configures logging for frozen environments,
-    sets application metadata and styles, displays a splash screen,
+    sets application metadata and style, displays a splash screen,
     and launches the main GUI window.
     """
     # Redirect stdout and stderr to a log file in frozen environment (e.g., PyInstaller)
@@ -47,22 +47,6 @@ def main():
     print(f"Current directory: {Path.cwd()}")
     print(f"Executable path: {sys.executable}")
 
-    # Set global application stylesheet for consistent look and feel
-    app.setStyleSheet(
-        """
-        * {
-            font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-        }
-        QToolTip {
-            background-color: #2c3e50;
-            color: #ecf0f1;
-            border: 1px solid #34495e;
-            border-radius: 4px;
-            padding: 5px;
-        }
-    """
-    )
-
     # Show splash screen during application initialization
     splash = SplashScreen()
     splash.show()
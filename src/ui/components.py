@@ -11,8 +11,6 @@ from PyQt6.QtWidgets import QPushButton, QProgressBar
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from src.ui.styles import AppStyles
-
 
 class ModernButton(QPushButton):
     """
@@ -37,9 +35,9 @@ class ModernButton(QPushButton):
         """
         Applies initial styling and properties to the button.
 
-        This includes setting the stylesheet, cursor shape, minimum height, and font.
+        This includes setting the cursor shape, minimum height, and font. The
+        button's look comes from the global stylesheet (`ModernButton` selector).
         """
-        self.setStyleSheet(AppStyles.get_button_style())
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMinimumHeight(30)
         self.setFont(QFont("Arial", 9))
@@ -67,7 +65,7 @@ class ModernProgressBar(QProgressBar):
         """
         Applies initial styling and properties to the progress bar.
 
-        This includes setting the minimum height and the stylesheet.
+        This includes setting the minimum height. The progress bar's look comes
+        from the global stylesheet (`ModernProgressBar` selector).
         """
         self.setMinimumHeight(20)
-        self.setStyleSheet(AppStyles.get_progress_style())
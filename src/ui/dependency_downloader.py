@@ -1,5 +1,5 @@
 from PyQt6.QtCore import QThread, pyqtSignal
-from src.utils.bin_checker import ensure_yt_dlp, ensure_ffmpeg, ensure_whisper_model
+from src.utils.bin_checker import ensure_all_binaries
 
 
 class DependencyDownloader(QThread):
@@ -12,20 +12,16 @@ class DependencyDownloader(QThread):
 
     def run(self):
         try:
-            if self.options.get("downloader") == "yt-dlp":
-                self.progress_updated.emit(0, "Checking for yt-dlp...")
-                if not ensure_yt_dlp(self.update_progress):
-                    self.finished.emit(False)
-                    return
-                self.progress_updated.emit(33, "Checking for ffmpeg...")
-                if not ensure_ffmpeg(self.update_progress):
-                    self.finished.emit(False)
-                    return
-            if self.options.get("transcribe"):
-                self.progress_updated.emit(66, "Checking for Whisper model...")
-                if not ensure_whisper_model(self.update_progress):
-                    self.finished.emit(False)
-                    return
+            needs_binaries = self.options.get("downloader") == "yt-dlp"
+            self.progress_updated.emit(0, "Checking dependencies...")
+            if not ensure_all_binaries(
+                self.update_progress,
+                yt_dlp=needs_binaries,
+                ffmpeg=needs_binaries,
+                whisper=bool(self.options.get("transcribe")),
+            ):
+                self.finished.emit(False)
+                return
             self.progress_updated.emit(100, "All dependencies are up to date.")
             self.finished.emit(True)
         except Exception as e:
@@ -24,12 +24,12 @@ from src.ui.progress_dialog import DownloadProgressDialog
 from src.ui.dependency_downloader import DependencyDownloader
 
 from PyQt6.QtWidgets import (
+    QApplication,
     QMainWindow,
     QWidget,
-    QListWidgetItem,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QIcon
 
 
@@ -55,7 +55,7 @@ class InstagramDownloaderGUI(QMainWindow):
         self.download_thread = None
         self.settings_manager = SettingsManager()
         self.panel_builder = PanelBuilder(self)
-        self.ui_elements = {}  # To store references to UI elements
+        self.ui_elements = None  # To store references to UI elements
 
         self.init_ui()
         self.load_settings()
@@ -77,13 +77,14 @@ class InstagramDownloaderGUI(QMainWindow):
         """
         Configures the main window properties.
 
-        Sets the window title, minimum size, initial size, stylesheet,
-        and application icon.
+        Sets the window title, minimum size, initial size and application icon,
+        and applies the global stylesheet to the QApplication once.
         """
         self.setWindowTitle("Instagram Media Downloader")
         self.setMinimumSize(1200, 800)
         self.resize(1200, 800)
-        self.setStyleSheet(AppStyles.get_main_style())
+        AppStyles.register_icon_search_path()
+        QApplication.instance().setStyleSheet(AppStyles.get_global_style())
         self.create_app_icon()
 
     def _create_main_layout(self):
@@ -101,41 +102,31 @@ class InstagramDownloaderGUI(QMainWindow):
         self.ui_elements = self.panel_builder.get_ui_elements()
 
         # Assign UI elements to self for easier access
-        self.url_input = self.ui_elements["url_input"]
-        self.add_button = self.ui_elements["add_button"]
-        self.downloader_combo = self.ui_elements["downloader_combo"]
-        self.video_check = self.ui_elements["video_check"]
-        self.thumbnail_check = self.ui_elements["thumbnail_check"]
-        self.audio_check = self.ui_elements["audio_check"]
-        self.caption_check = self.ui_elements["caption_check"]
-        self.transcribe_check = self.ui_elements["transcribe_check"]
-        self.download_button = self.ui_elements["download_button"]
-        self.clear_button = self.ui_elements["clear_button"]
-        self.folder_button = self.ui_elements["folder_button"]
-        self.overall_progress = self.ui_elements["overall_progress"]
-        self.progress_label = self.ui_elements["progress_label"]
-        self.queue_list = self.ui_elements["queue_list"]
-        self.results_text = self.ui_elements["results_text"]
-        self.tab_widget = self.ui_elements["tab_widget"]
+        self.url_input = self.ui_elements.url_input
+        self.add_button = self.ui_elements.add_button
+        self.downloader_combo = self.ui_elements.downloader_combo
+        self.video_check = self.ui_elements.video_check
+        self.thumbnail_check = self.ui_elements.thumbnail_check
+        self.audio_check = self.ui_elements.audio_check
+        self.caption_check = self.ui_elements.caption_check
+        self.transcribe_check = self.ui_elements.transcribe_check
+        self.download_button = self.ui_elements.download_button
+        self.clear_button = self.ui_elements.clear_button
+        self.folder_button = self.ui_elements.folder_button
+        self.overall_progress = self.ui_elements.overall_progress
+        self.progress_label = self.ui_elements.progress_label
+        self.queue_list = self.ui_elements.queue_list
+        self.queue_model = self.ui_elements.queue_model
+        self.results_text = self.ui_elements.results_text
+        self.tab_widget = self.ui_elements.tab_widget
 
     def _setup_status_bar(self):
         """
         Configures the application's status bar.
 
-        Sets an initial message and applies custom styling.
+        Sets an initial message. Styling comes from the global stylesheet.
         """
         self.statusBar().showMessage("Ready to download Instagram Reels")
-        self.statusBar().setStyleSheet(
-            """
-            QStatusBar {
-                background-color: #1a1a1a;
-                color: #ecf0f1;
-                font-size: 12px;
-                padding: 5px;
-                border-top: 1px solid #333333;
-            }
-        """
-        )
 
     def create_app_icon(self):
         """
@@ -179,16 +170,27 @@ class InstagramDownloaderGUI(QMainWindow):
         reel_item = ReelItem(url=url)
         self.reel_queue.append(reel_item)
 
+        # Rows of the queue model line up with `reel_queue`
         display_url = f"🔗 {url[:50]}{'...' if len(url) > 50 else ''}"
-        list_item = QListWidgetItem(display_url)
-        list_item.setData(Qt.ItemDataRole.UserRole, reel_item)
-        self.queue_list.addItem(list_item)
+        row = self.queue_model.rowCount()
+        self.queue_model.insertRows(row, 1)
+        self._set_queue_text(row, display_url)
 
         self.url_input.clear()
         self.statusBar().showMessage(
             f"Added to queue. Total items: {len(self.reel_queue)}"
         )
 
+    def _set_queue_text(self, row: int, text: str):
+        """
+        Sets the display text of a row in the queue list.
+
+        Args:
+            row (int): The row index, matching the item's index in `reel_queue`.
+            text (str): The text to display for the row.
+        """
+        self.queue_model.setData(self.queue_model.index(row), text)
+
     def clear_queue(self):
         """
         Clears the download queue and resets the UI elements related to the queue.
@@ -202,7 +204,7 @@ class InstagramDownloaderGUI(QMainWindow):
             return
 
         self.reel_queue.clear()
-        self.queue_list.clear()
+        self.queue_model.setStringList([])
         self.results_text.clear()
         self.overall_progress.setValue(0)
         self.progress_label.setText("Ready to start downloading...")
@@ -287,18 +289,18 @@ class InstagramDownloaderGUI(QMainWindow):
             status (str): A descriptive status message for the current operation.
         """
         if url:
-            for i in range(self.queue_list.count()):
-                item = self.queue_list.item(i)
-                reel_item = item.data(Qt.ItemDataRole.UserRole)
+            for row, reel_item in enumerate(self.reel_queue):
                 if reel_item.url == url:
                     reel_item.progress = progress
                     reel_item.status = status
 
                     url_short = url[:40] + "..." if len(url) > 40 else url
                     if progress == 100:
-                        item.setText(f"✅ {url_short} - {status}")
+                        self._set_queue_text(row, f"✅ {url_short} - {status}")
                     else:
-                        item.setText(f"📥 {url_short} - {status} ({progress}%)")
+                        self._set_queue_text(
+                            row, f"📥 {url_short} - {status} ({progress}%)"
+                        )
                     break
         else:
             self.progress_label.setText(status)
@@ -320,8 +322,10 @@ class InstagramDownloaderGUI(QMainWindow):
             result_data (Dict[str, Any]): A dictionary containing paths and metadata
                                           of the downloaded files.
         """
-        for item in self.reel_queue:
+        for row, item in enumerate(self.reel_queue):
             if item.url == url:
+                url_short = url[:40] + "..." if len(url) > 40 else url
+                self._set_queue_text(row, f"✅ {url_short} - Completed")
                 item.status = "Completed"
                 item.progress = 100
                 item.title = result_data.get("title", "Unknown")
@@ -335,14 +339,6 @@ class InstagramDownloaderGUI(QMainWindow):
 
         self._add_to_results(url, result_data)
 
-        for i in range(self.queue_list.count()):
-            list_item = self.queue_list.item(i)
-            reel_item = list_item.data(Qt.ItemDataRole.UserRole)
-            if reel_item.url == url:
-                url_short = url[:40] + "..." if len(url) > 40 else url
-                list_item.setText(f"✅ {url_short} - Completed")
-                break
-
     def download_error(self, url: str, error_message: str):
         """
         Handles errors that occur during a single reel download.
@@ -355,22 +351,18 @@ class InstagramDownloaderGUI(QMainWindow):
             url (str): The URL of the reel that encountered an error.
             error_message (str): The error message describing the failure.
         """
-        for item in self.reel_queue:
+        for row, item in enumerate(self.reel_queue):
             if item.url == url:
                 item.status = "Error"
                 item.error_message = error_message
-                break
-
-        self.results_text.append(f"\n❌ ERROR for {url}:\n{error_message}\n" + "=" * 60)
-
-        for i in range(self.queue_list.count()):
-            list_item = self.queue_list.item(i)
-            reel_item = list_item.data(Qt.ItemDataRole.UserRole)
-            if reel_item.url == url:
                 url_short = url[:40] + "..." if len(url) > 40 else url
-                list_item.setText(f"❌ {url_short} - Error")
+                self._set_queue_text(row, f"❌ {url_short} - Error")
                 break
 
+        self.results_text.appendPlainText(
+            f"\n❌ ERROR for {url}:\n{error_message}\n" + "=" * 60
+        )
+
     def download_finished(self):
         """
         Handles the completion of the entire download thread.
@@ -420,7 +412,7 @@ class InstagramDownloaderGUI(QMainWindow):
             result_text += f"🎤 Transcript: {result_data['transcript_path']}\n"
 
         result_text += "=" * 50
-        self.results_text.append(result_text)
+        self.results_text.appendPlainText(result_text)
 
         self.tab_widget.setCurrentIndex(1)
 
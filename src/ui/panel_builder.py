@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from collections import namedtuple
+from typing import Any
 
 from PyQt6.QtWidgets import (
     QWidget,
@@ -6,8 +7,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QTextEdit,
-    QListWidget,
+    QPlainTextEdit,
+    QListView,
     QTabWidget,
     QFrame,
     QCheckBox,
@@ -15,11 +16,35 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QComboBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QStringListModel
 from PyQt6.QtGui import QFont
 
 from src.ui.components import ModernButton, ModernProgressBar
-from src.ui.styles import AppStyles
+
+
+# Read-only view of the widgets the main window needs from the builder
+UIElements = namedtuple(
+    "UIElements",
+    [
+        "url_input",
+        "add_button",
+        "downloader_combo",
+        "video_check",
+        "thumbnail_check",
+        "audio_check",
+        "caption_check",
+        "transcribe_check",
+        "download_button",
+        "clear_button",
+        "folder_button",
+        "overall_progress",
+        "progress_label",
+        "queue_list",
+        "queue_model",
+        "results_text",
+        "tab_widget",
+    ],
+)
 
 
 class PanelBuilder:
@@ -28,9 +53,42 @@ class PanelBuilder:
 
     This class encapsulates the creation of the left control panel and the right
     tabbed panel, promoting modularity and reusability in the UI structure.
-    It initializes and holds references to all major UI widgets.
+    It initializes and holds references to all major UI widgets. Widgets are
+    styled by the application-wide stylesheet from `AppStyles.get_global_style()`
+    through their object names and dynamic properties.
     """
 
+    __slots__ = (
+        "main_window",
+        "url_input",
+        "add_button",
+        "downloader_combo",
+        "video_check",
+        "thumbnail_check",
+        "audio_check",
+        "caption_check",
+        "transcribe_check",
+        "download_button",
+        "clear_button",
+        "folder_button",
+        "overall_progress",
+        "progress_label",
+        "queue_list",
+        "queue_model",
+        "results_text",
+        "tab_widget",
+        "_tab_builders",
+        "_tab_built",
+        "_ui_elements",
+        # Needed to connect bound methods of this object to Qt signals
+        "__weakref__",
+    )
+
+    # Fonts are shared by every instance; QFont is implicitly shared by Qt
+    _TITLE_FONT = QFont("Arial", 20, QFont.Weight.Bold)
+    _SUBTITLE_FONT = QFont("Arial", 12)
+    _HEADER_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+
     def __init__(self, main_window_instance: Any):
         """
         Initializes the PanelBuilder with a reference to the main window instance.
@@ -56,36 +114,61 @@ class PanelBuilder:
         self.folder_button = ModernButton("📁 Open Downloads")
         self.overall_progress = ModernProgressBar()
         self.progress_label = QLabel("Ready to start downloading...")
-        self.queue_list = QListWidget()
-        self.results_text = QTextEdit()
+        self.queue_model = QStringListModel()
+        self.queue_list = QListView()
+        self.queue_list.setModel(self.queue_model)
+        self.queue_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.results_text = QPlainTextEdit()
+        # Set up front because MainWindow logs here before the lazily built
+        # Results tab exists; dropping the oldest lines keeps memory bounded
+        self.results_text.setReadOnly(True)
+        self.results_text.setMaximumBlockCount(5000)
         self.tab_widget = QTabWidget()
+        self._ui_elements = None
+
+        # Object names and dynamic properties used by the global stylesheet
+        self.url_input.setObjectName("urlInput")
+        self.downloader_combo.setObjectName("downloaderCombo")
+        self.clear_button.setProperty("role", "danger")
+        self.folder_button.setProperty("role", "success")
+        self.queue_list.setObjectName("queueList")
+        self.results_text.setObjectName("resultsText")
+        self.tab_widget.setObjectName("mainTabs")
 
     def create_main_layout(self, central_widget: QWidget):
         """
         Creates and sets up the main application layout within the central widget.
 
         This method arranges the left control panel and the right tabbed panel
-        using a QSplitter to allow for resizable sections.
+        using a QSplitter to allow for resizable sections. Updates on the central
+        widget are disabled while it is built so Qt lays it out and paints it once.
 
         Args:
             central_widget (QWidget): The central widget of the QMainWindow
                                       where the main layout will be applied.
         """
-        main_layout = QHBoxLayout(central_widget)
-        main_layout.setSpacing(15)
-        main_layout.setContentsMargins(15, 15, 15, 15)
-
-        left_panel = self._create_left_panel()
-        right_panel = self._create_right_panel()
-
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.addWidget(left_panel)
-        splitter.addWidget(right_panel)
-        splitter.setSizes([350, 850])  # Initial sizes for the panels
-        splitter.setStretchFactor(0, 0)  # Left panel not stretchable
-        splitter.setStretchFactor(1, 1)  # Right panel stretches
-
-        main_layout.addWidget(splitter)
+        # Hold back paint and layout updates until the whole tree is assembled
+        central_widget.setUpdatesEnabled(False)
+        try:
+            main_layout = QHBoxLayout(central_widget)
+            main_layout.setSpacing(15)
+            main_layout.setContentsMargins(15, 15, 15, 15)
+
+            left_panel = self._create_left_panel()
+            right_panel = self._create_right_panel()
+
+            splitter = QSplitter(Qt.Orientation.Horizontal)
+            splitter.addWidget(left_panel)
+            splitter.addWidget(right_panel)
+            splitter.setStretchFactor(0, 0)  # Left panel not stretchable
+            splitter.setStretchFactor(1, 1)  # Right panel stretches
+            # Apply the initial panel sizes once the event loop runs, after the window
+            # has been shown and laid out, instead of computing them twice
+            QTimer.singleShot(0, lambda: splitter.setSizes([350, 850]))
+
+            main_layout.addWidget(splitter)
+        finally:
+            central_widget.setUpdatesEnabled(True)
 
     def _create_left_panel(self) -> QWidget:
         """
@@ -98,22 +181,22 @@ class PanelBuilder:
         """
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel)
-        panel.setStyleSheet(AppStyles.get_panel_style())
+        panel.setObjectName("leftPanel")
         panel.setMaximumWidth(500)
 
+        # All sections share one flat layout to keep the layout tree shallow
         layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
+        layout.setSpacing(10)
 
-        top_layout = QVBoxLayout()
-        self._add_title_section(top_layout)
-        self._add_url_input_section(top_layout)
-        self._add_downloader_selection_section(top_layout)
-        self._add_download_options_section(top_layout)
+        self._add_title_section(layout)
+        self._add_url_input_section(layout)
+        self._add_downloader_selection_section(layout)
+        self._add_download_options_section(layout)
 
-        layout.addLayout(top_layout)
         layout.addStretch()
 
         self._add_control_buttons_section(layout)
+        layout.addSpacing(10)
         self._add_progress_section(layout)
 
         return panel
@@ -126,15 +209,15 @@ class PanelBuilder:
             layout (QVBoxLayout): The layout to which the title and subtitle labels will be added.
         """
         title_label = QLabel("Instagram Reels\nDownloader")
-        title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title_label.setFont(PanelBuilder._TITLE_FONT)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("color: #2c3e50; margin-bottom: 5px;")
+        title_label.setObjectName("appTitle")
         layout.addWidget(title_label)
 
         subtitle_label = QLabel("Download, Extract & Transcribe")
-        subtitle_label.setFont(QFont("Arial", 12))
+        subtitle_label.setFont(PanelBuilder._SUBTITLE_FONT)
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle_label.setStyleSheet("color: #7f8c8d; margin-bottom: 15px;")
+        subtitle_label.setObjectName("appSubtitle")
         layout.addWidget(subtitle_label)
 
     def _add_url_input_section(self, layout: QVBoxLayout):
@@ -145,12 +228,10 @@ class PanelBuilder:
             layout (QVBoxLayout): The layout to which the URL input section will be added.
         """
         url_group = QGroupBox("📎 Add Reel URL")
-        url_group.setStyleSheet(AppStyles.get_group_style())
         url_layout = QVBoxLayout(url_group)
         url_layout.setSpacing(10)
 
         self.url_input.setPlaceholderText("Paste Instagram Reel URL here...")
-        self.url_input.setStyleSheet(AppStyles.get_input_style())
         # Connect returnPressed signal to main window's add_to_queue slot
         self.url_input.returnPressed.connect(self.main_window.add_to_queue)
 
@@ -170,15 +251,12 @@ class PanelBuilder:
             layout (QVBoxLayout): The layout to which the downloader selection will be added.
         """
         downloader_group = QGroupBox("⬇️ Downloader")
-        downloader_group.setStyleSheet(AppStyles.get_group_style())
         downloader_layout = QVBoxLayout(downloader_group)
         downloader_layout.setSpacing(10)
 
         self.downloader_combo.addItems(["Instaloader", "yt-dlp"])
-        self.downloader_combo.setStyleSheet(AppStyles.get_combo_box_style())
 
         downloader_layout.addWidget(self.downloader_combo)
-        downloader_group.setLayout(downloader_layout)
         layout.addWidget(downloader_group)
 
     def _add_download_options_section(self, layout: QVBoxLayout):
@@ -189,29 +267,27 @@ class PanelBuilder:
             layout (QVBoxLayout): The layout to which the download options will be added.
         """
         options_group = QGroupBox("⚙️ Download Options")
-        options_group.setStyleSheet(AppStyles.get_group_style())
+        options_group.setObjectName("optionsGroup")
         options_group.setMinimumHeight(110)
         options_layout = QVBoxLayout(options_group)
         options_layout.setSpacing(8)
 
-        # Set initial checked state for checkboxes
-        self.video_check.setChecked(True)
-        self.thumbnail_check.setChecked(True)
-        self.audio_check.setChecked(True)
-        self.caption_check.setChecked(True)
-        self.transcribe_check.setChecked(False)
-
+        # Checkboxes paired with their initial checked state
         checkboxes = [
-            self.video_check,
-            self.thumbnail_check,
-            self.audio_check,
-            self.caption_check,
-            self.transcribe_check,
+            (self.video_check, True),
+            (self.thumbnail_check, True),
+            (self.audio_check, True),
+            (self.caption_check, True),
+            (self.transcribe_check, False),
         ]
 
-        for checkbox in checkboxes:
-            checkbox.setStyleSheet(AppStyles.get_checkbox_style())
-            checkbox.setMinimumHeight(25)
+        # Size and look come from the `#optionsGroup QCheckBox` rule, which
+        # cascades to every checkbox in the group. The initial state is set with
+        # signals blocked so no stateChanged is emitted while building.
+        for checkbox, checked in checkboxes:
+            checkbox.blockSignals(True)
+            checkbox.setChecked(checked)
+            checkbox.blockSignals(False)
             options_layout.addWidget(checkbox)
 
         layout.addWidget(options_group)
@@ -224,20 +300,13 @@ class PanelBuilder:
         Args:
             layout (QVBoxLayout): The layout to which the control buttons will be added.
         """
-        controls_layout = QVBoxLayout()
-        controls_layout.setSpacing(10)
-
         self.download_button.clicked.connect(self.main_window.start_download)
         self.clear_button.clicked.connect(self.main_window.clear_queue)
-        self.clear_button.setStyleSheet(AppStyles.get_danger_button_style())
         self.folder_button.clicked.connect(self.main_window.open_downloads_folder)
-        self.folder_button.setStyleSheet(AppStyles.get_success_button_style())
-
-        controls_layout.addWidget(self.download_button)
-        controls_layout.addWidget(self.clear_button)
-        controls_layout.addWidget(self.folder_button)
 
-        layout.addLayout(controls_layout)
+        layout.addWidget(self.download_button)
+        layout.addWidget(self.clear_button)
+        layout.addWidget(self.folder_button)
 
     def _add_progress_section(self, layout: QVBoxLayout):
         """
@@ -247,18 +316,10 @@ class PanelBuilder:
             layout (QVBoxLayout): The layout to which the progress section will be added.
         """
         progress_group = QGroupBox("📊 Overall Progress")
-        progress_group.setStyleSheet(AppStyles.get_group_style())
         progress_layout = QVBoxLayout(progress_group)
         progress_layout.setSpacing(10)
 
-        self.progress_label.setStyleSheet(
-            """
-            color: #2c3e50;
-            font-size: 13px;
-            font-weight: bold;
-            padding: 2px;
-        """
-        )
+        self.progress_label.setObjectName("progressLabel")
         self.progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         progress_layout.addWidget(self.overall_progress)
@@ -277,19 +338,51 @@ class PanelBuilder:
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.tab_widget.setStyleSheet(AppStyles.get_tab_style())
         self.tab_widget.tabBar().setExpanding(True)
 
-        queue_widget = self._create_queue_tab()
-        results_widget = self._create_results_tab()
+        # Tabs start as empty placeholders and are built the first time they are shown
+        self._tab_builders = {0: self._create_queue_tab, 1: self._create_results_tab}
+        self._tab_built = {0: False, 1: False}
 
-        self.tab_widget.addTab(queue_widget, "📋 Download Queue")
-        self.tab_widget.addTab(results_widget, "✅ Results")
+        self.tab_widget.addTab(QWidget(), "📋 Download Queue")
+        self.tab_widget.addTab(QWidget(), "✅ Results")
+        self._ensure_tab_built(0)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tab_widget)
 
         return panel
 
+    def _ensure_tab_built(self, index: int):
+        """
+        Replaces the placeholder of a tab with its real content on first use.
+
+        `queue_list` and `results_text` exist from `__init__`, so the main window
+        can fill them before their tab has been built.
+
+        Args:
+            index (int): The index of the tab that is about to be shown.
+        """
+        if self._tab_built.get(index, True):
+            return
+
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        is_current = self.tab_widget.currentIndex() == index
+
+        # Avoid re-entering this slot while the tab is swapped out
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, self._tab_builders[index](), title)
+            if is_current:
+                self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+
+        placeholder.deleteLater()
+        self._tab_built[index] = True
+
     def _create_queue_tab(self) -> QWidget:
         """
         Creates the "Download Queue" tab content.
@@ -304,11 +397,10 @@ class PanelBuilder:
         layout.setContentsMargins(15, 15, 15, 15)
 
         header = QLabel("Download Queue")
-        header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #2c3e50; margin-bottom: 10px;")
+        header.setFont(PanelBuilder._HEADER_FONT)
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
 
-        self.queue_list.setStyleSheet(AppStyles.get_list_style())
         self.queue_list.setMinimumHeight(400)
 
         layout.addWidget(self.queue_list)
@@ -329,44 +421,46 @@ class PanelBuilder:
         layout.setContentsMargins(15, 15, 15, 15)
 
         header = QLabel("Download Results")
-        header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #2c3e50; margin-bottom: 10px;")
+        header.setFont(PanelBuilder._HEADER_FONT)
+        header.setObjectName("tabHeader")
         layout.addWidget(header)
 
-        self.results_text.setStyleSheet(AppStyles.get_text_style())
-        self.results_text.setReadOnly(True)
         self.results_text.setMinimumHeight(400)
 
         layout.addWidget(self.results_text)
 
         return widget
 
-    def get_ui_elements(self) -> Dict[str, Any]:
+    def get_ui_elements(self) -> UIElements:
         """
-        Returns a dictionary of key UI elements initialized by the PanelBuilder.
+        Returns the key UI elements initialized by the PanelBuilder.
 
         This allows the main window to easily access and interact with specific
-        widgets created by the builder.
+        widgets created by the builder. The tuple is built on the first call
+        and the same object is returned afterwards.
 
         Returns:
-            Dict[str, Any]: A dictionary where keys are descriptive names
-                            and values are the corresponding PyQt widgets.
+            UIElements: A named tuple whose fields are descriptive names
+                        and values are the corresponding PyQt widgets.
         """
-        return {
-            "url_input": self.url_input,
-            "add_button": self.add_button,
-            "downloader_combo": self.downloader_combo,
-            "video_check": self.video_check,
-            "thumbnail_check": self.thumbnail_check,
-            "audio_check": self.audio_check,
-            "caption_check": self.caption_check,
-            "transcribe_check": self.transcribe_check,
-            "download_button": self.download_button,
-            "clear_button": self.clear_button,
-            "folder_button": self.folder_button,
-            "overall_progress": self.overall_progress,
-            "progress_label": self.progress_label,
-            "queue_list": self.queue_list,
-            "results_text": self.results_text,
-            "tab_widget": self.tab_widget,
-        }
+        if self._ui_elements is None:
+            self._ui_elements = UIElements(
+                url_input=self.url_input,
+                add_button=self.add_button,
+                downloader_combo=self.downloader_combo,
+                video_check=self.video_check,
+                thumbnail_check=self.thumbnail_check,
+                audio_check=self.audio_check,
+                caption_check=self.caption_check,
+                transcribe_check=self.transcribe_check,
+                download_button=self.download_button,
+                clear_button=self.clear_button,
+                folder_button=self.folder_button,
+                overall_progress=self.overall_progress,
+                progress_label=self.progress_label,
+                queue_list=self.queue_list,
+                queue_model=self.queue_model,
+                results_text=self.results_text,
+                tab_widget=self.tab_widget,
+            )
+        return self._ui_elements
@@ -3,6 +3,8 @@ from PyQt6.QtCore import Qt
 
 
 class DownloadProgressDialog(QProgressDialog):
+    __slots__ = ()
+
     def __init__(self, parent=None):
         super().__init__("Downloading...", "Cancel", 0, 100, parent)
         self.setWindowModality(Qt.WindowModality.WindowModal)
@@ -1,5 +1,394 @@
+import re
+from typing import Optional
+
+from PyQt6.QtCore import QDir
 from PyQt6.QtGui import QColor, QBrush, QPainter, QPixmap
 
+from src.utils.resource_loader import get_resource_path
+
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_QSS_WHITESPACE = re.compile(r"\s+")
+
+
+def _minify(css: str) -> str:
+    """
+    Strips comments and collapses whitespace in a QSS string.
+
+    Qt's stylesheet parser ignores both, so the result is equivalent but
+    shorter to tokenize.
+    """
+    return _QSS_WHITESPACE.sub(" ", _QSS_COMMENT.sub("", css)).strip()
+
+
+# Colors shared by the stylesheets below; Qt's QSS has no variables of its own
+_PALETTE = {
+    "background": "#1a1a1a",
+    "surface": "#222222",
+    "border": "#333333",
+    "text": "#ecf0f1",
+    "accent": "#667eea",
+    "muted": "#7f8c8d",
+}
+
+
+def _qss(template: str) -> str:
+    """
+    Fills the palette colors into a QSS template and minifies the result.
+    """
+    return _minify(template.format(**_PALETTE))
+
+
+# Stylesheets are built once at import time and shared by every caller.
+_MAIN_STYLE = _qss(
+    """
+* {{
+    font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+}}
+QToolTip {{
+    background-color: #2c3e50;
+    color: {text};
+    border: 1px solid #34495e;
+    border-radius: 4px;
+    padding: 5px;
+}}
+QMainWindow {{
+    background: {background}; /* Black background */
+    color: {text}; /* Light text */
+}}
+"""
+)
+
+_STATUS_BAR_STYLE = _qss(
+    """
+QStatusBar {{
+    background-color: {background};
+    color: {text};
+    font-size: 12px;
+    padding: 5px;
+    border-top: 1px solid {border};
+}}
+"""
+)
+
+_PANEL_STYLE = _qss(
+    """
+QFrame#leftPanel {{
+    background-color: {background}; /* Black panel background */
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    padding: 5px;
+}}
+"""
+)
+
+_BUTTON_STYLE = _qss(
+    """
+ModernButton {{
+    background-color: {border}; /* Black button background */
+    border-radius: 5px;
+    color: {text}; /* Light text */
+    padding: 8px 16px;
+    font-size: 11px;
+    font-weight: bold;
+    border: none;
+}}
+ModernButton:hover {{
+    background-color: #444444; /* Slightly lighter on hover */
+}}
+ModernButton:pressed {{
+    background-color: {surface}; /* Darker on pressed */
+}}
+ModernButton:disabled {{
+    background-color: {background}; /* Disabled background */
+    color: {muted}; /* Disabled text */
+}}
+"""
+)
+
+_DANGER_BUTTON_STYLE = _qss(
+    """
+ModernButton[role="danger"] {{
+    background-color: #8b0000; /* Darker red for danger */
+    border-radius: 5px;
+    color: {text}; /* Light text */
+    padding: 8px 16px;
+    font-size: 11px;
+    font-weight: bold;
+    border: none;
+}}
+ModernButton[role="danger"]:hover {{
+    background-color: #a00000; /* Slightly lighter on hover */
+}}
+ModernButton[role="danger"]:pressed {{
+    background-color: #700000; /* Darker on pressed */
+}}
+ModernButton[role="danger"]:disabled {{
+    background-color: {background}; /* Disabled background */
+    color: {muted}; /* Disabled text */
+}}
+"""
+)
+
+_SUCCESS_BUTTON_STYLE = _qss(
+    """
+ModernButton[role="success"] {{
+    background-color: #006400; /* Darker green for success */
+    border-radius: 5px;
+    color: {text}; /* Light text */
+    padding: 8px 16px;
+    font-size: 11px;
+    font-weight: bold;
+    border: none;
+}}
+ModernButton[role="success"]:hover {{
+    background-color: #008000; /* Slightly lighter on hover */
+}}
+ModernButton[role="success"]:pressed {{
+    background-color: #004d00; /* Darker on pressed */
+}}
+ModernButton[role="success"]:disabled {{
+    background-color: {background}; /* Disabled background */
+    color: {muted}; /* Disabled text */
+}}
+"""
+)
+
+_GROUP_STYLE = _qss(
+    """
+QFrame#leftPanel QGroupBox {{
+    font-weight: bold;
+    font-size: 15px;
+    color: {text}; /* Light text for title */
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    background-color: {background}; /* Black background */
+    margin-top: 5px;
+    padding-top: 5px; 
+}}
+QFrame#leftPanel QGroupBox::title {{
+    subcontrol-origin: margin;
+    left: 15px;
+    padding: 0 10px 0 10px;
+    background-color: {background}; /* Match groupbox background */
+}}
+"""
+)
+
+_INPUT_STYLE = _qss(
+    """
+QLineEdit#urlInput {{
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    padding: 8px 12px;
+    font-size: 13px;
+    background-color: {surface}; /* Black input background */
+    color: {text}; /* Light text */
+    min-height: 20px;
+}}
+QLineEdit#urlInput:focus {{
+    border-color: {accent}; /* Accent color on focus */
+    outline: none;
+}}
+QLineEdit#urlInput::placeholder {{
+    color: #95a5a6; /* Placeholder color */
+}}
+"""
+)
+
+_CHECKBOX_STYLE = _qss(
+    """
+QGroupBox#optionsGroup QCheckBox {{
+    font-size: 13px;
+    color: {text}; /* Light text */
+    min-height: 25px;
+}}
+QGroupBox#optionsGroup QCheckBox::indicator {{
+    width: 12px;
+    height: 12px;
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 3px;
+    background-color: {surface}; /* Black background */
+}}
+QGroupBox#optionsGroup QCheckBox::indicator:unchecked {{
+    background-color: {surface};
+}}
+QGroupBox#optionsGroup QCheckBox::indicator:checked {{
+    background-color: {accent}; /* Accent color when checked */
+    image: url(icons:check.svg);
+}}
+QGroupBox#optionsGroup QCheckBox::indicator:hover {{
+    border-color: {accent}; /* Accent color on hover */
+}}
+"""
+)
+
+_TAB_STYLE = _qss(
+    """
+QTabWidget#mainTabs::pane {{
+    border: 1px solid {border};
+    border-radius: 5px;
+    background-color: {background};
+    padding: 15px;
+    min-width: 300px; /* Reasonable minimum width */
+}}
+QTabWidget#mainTabs QTabBar::tab {{
+    background: {surface};
+    border: 1px solid {border};
+    padding: 8px 15px;
+    font-size: 12px;
+    font-weight: bold;
+    color: {text};
+    text-align: center;
+    white-space: nowrap;
+}}
+QTabWidget#mainTabs QTabBar::tab:selected {{
+    background: {background}; /* Main background color when selected */
+    border-bottom-color: {background}; /* Hide bottom border */
+    color: {accent}; /* Accent color for selected tab */
+}}
+QTabWidget#mainTabs QTabBar::tab:hover:!selected {{
+    background: {border}; /* Slightly lighter on hover */
+}}
+"""
+)
+
+_LIST_STYLE = _qss(
+    """
+QListView#queueList {{
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    background-color: {background}; /* Black background */
+    font-size: 13px;
+    padding: 5px;
+    color: {text}; /* Light text */
+}}
+QListView#queueList::item {{
+    padding: 8px 5px;
+    border-bottom: 1px solid {border}; /* Darker separator */
+    border-radius: 3px;
+    margin: 1px 0;
+}}
+QListView#queueList::item:selected {{
+    background-color: {accent}; /* Accent color when selected */
+    color: #ffffff;
+    border: none;
+}}
+QListView#queueList::item:hover {{
+    background-color: {surface}; /* Slightly lighter on hover */
+}}
+"""
+)
+
+_LABEL_STYLE = _qss(
+    """
+QLabel#appTitle {{
+    color: #2c3e50;
+    margin-bottom: 5px;
+}}
+QLabel#appSubtitle {{
+    color: {muted};
+    margin-bottom: 15px;
+}}
+QLabel#tabHeader {{
+    color: #2c3e50;
+    margin-bottom: 10px;
+}}
+QLabel#progressLabel {{
+    color: #2c3e50;
+    font-size: 13px;
+    font-weight: bold;
+    padding: 2px;
+}}
+"""
+)
+
+_TEXT_STYLE = _qss(
+    """
+QPlainTextEdit#resultsText {{
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    background-color: {surface}; /* Black background */
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    font-size: 12px;
+    padding: 10px;
+    color: {text}; /* Light text */
+    line-height: 1.4;
+}}
+"""
+)
+
+_COMBO_BOX_STYLE = _qss(
+    """
+QComboBox#downloaderCombo {{
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    padding: 8px 12px;
+    font-size: 13px;
+    background-color: {surface}; /* Black background */
+    color: {text}; /* Light text */
+    min-height: 20px;
+}}
+QComboBox#downloaderCombo:focus {{
+    border-color: {accent}; /* Accent color on focus */
+    outline: none;
+}}
+QComboBox#downloaderCombo::drop-down {{
+    border: none;
+}}
+QComboBox#downloaderCombo::down-arrow {{
+    image: url(icons:chevron.svg); /* Light arrow */
+    width: 16px;
+    height: 16px;
+    margin-right: 10px;
+}}
+QComboBox#downloaderCombo QAbstractItemView {{
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 5px;
+    background-color: {surface}; /* Black background */
+    color: {text}; /* Light text */
+    selection-background-color: {accent}; /* Accent color on selection */
+}}
+"""
+)
+
+_PROGRESS_STYLE = _qss(
+    """
+ModernProgressBar {{
+    border: 1px solid {border}; /* Darker border */
+    border-radius: 8px;
+    background-color: {surface}; /* Black background */
+    text-align: center;
+    color: {text}; /* Light text */
+    font-weight: bold;
+}}
+ModernProgressBar::chunk {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {accent}, stop:1 #764ba2); /* Accent gradient */
+    border-radius: 7px;
+}}
+"""
+)
+
+_GLOBAL_STYLE = "".join(
+    (
+        _MAIN_STYLE,
+        _STATUS_BAR_STYLE,
+        _PANEL_STYLE,
+        _GROUP_STYLE,
+        _INPUT_STYLE,
+        _COMBO_BOX_STYLE,
+        _CHECKBOX_STYLE,
+        _BUTTON_STYLE,
+        _DANGER_BUTTON_STYLE,
+        _SUCCESS_BUTTON_STYLE,
+        _PROGRESS_STYLE,
+        _TAB_STYLE,
+        _LIST_STYLE,
+        _TEXT_STYLE,
+        _LABEL_STYLE,
+    )
+)
+
 
 class AppStyles:
     """
@@ -7,22 +396,53 @@ class AppStyles:
 
     This class provides static methods to retrieve stylesheets for various
     GUI components, promoting consistency and maintainability across the application's
-    user interface. It also includes a method to programmatically create an application icon.
+    user interface. The individual rules are scoped with object names and dynamic
+    properties so that they can be combined by `get_global_style()` and applied once
+    at the QApplication level. It also includes a method to programmatically create
+    an application icon.
     """
 
+    _app_icon_pixmap: Optional[QPixmap] = None
+
+    @staticmethod
+    def get_global_style() -> str:
+        """
+        Returns the combined stylesheet for the whole application.
+
+        All component rules are concatenated into a single string so that Qt parses
+        the stylesheet once and widgets are only polished against one shared sheet,
+        instead of each widget carrying its own stylesheet.
+        """
+        return _GLOBAL_STYLE
+
+    @staticmethod
+    def register_icon_search_path():
+        """
+        Registers the `icons:` search path used by the stylesheets.
+
+        The checkbox tick and combo-box chevron are SVG files under
+        `resources/icons`; Qt loads and caches them by path instead of decoding
+        inline data URIs on every re-polish. Must be called before the global
+        stylesheet is applied.
+        """
+        QDir.addSearchPath("icons", str(get_resource_path("resources/icons")))
+
     @staticmethod
     def get_main_style() -> str:
         """
         Returns the stylesheet for the main application window.
 
-        This style applies a gradient background to the QMainWindow.
+        This style sets the application-wide font and tooltip appearance and
+        applies a dark background to the QMainWindow.
         """
-        return """
-        QMainWindow {
-            background: #1a1a1a; /* Black background */
-            color: #ecf0f1; /* Light text */
-        }
+        return _MAIN_STYLE
+
+    @staticmethod
+    def get_status_bar_style() -> str:
         """
+        Returns the stylesheet for the main window's status bar.
+        """
+        return _STATUS_BAR_STYLE
 
     @staticmethod
     def get_panel_style() -> str:
@@ -32,14 +452,7 @@ class AppStyles:
         This style applies a modern design with a dark background,
         rounded borders, and a subtle shadow.
         """
-        return """
-        QFrame {
-            background-color: #1a1a1a; /* Black panel background */
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            padding: 5px;
-        }
-        """
+        return _PANEL_STYLE
 
     @staticmethod
     def get_button_style() -> str:
@@ -47,29 +460,9 @@ class AppStyles:
         Returns the stylesheet for a general-purpose button.
 
         This style provides a neutral gradient background with hover, pressed,
-        and disabled states for visual feedback.
-        """
-        return """
-        QPushButton {
-            background-color: #333333; /* Black button background */
-            border-radius: 5px;
-            color: #ecf0f1; /* Light text */
-            padding: 8px 16px;
-            font-size: 11px;
-            font-weight: bold;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #444444; /* Slightly lighter on hover */
-        }
-        QPushButton:pressed {
-            background-color: #222222; /* Darker on pressed */
-        }
-        QPushButton:disabled {
-            background-color: #1a1a1a; /* Disabled background */
-            color: #7f8c8d; /* Disabled text */
-        }
+        and disabled states for visual feedback. It applies to every `ModernButton`.
         """
+        return _BUTTON_STYLE
 
     @staticmethod
     def get_danger_button_style() -> str:
@@ -77,29 +470,10 @@ class AppStyles:
         Returns the stylesheet for danger/delete action buttons.
 
         This style provides a red gradient background with hover, pressed,
-        and disabled states for visual feedback.
-        """
-        return """
-        QPushButton {
-            background-color: #8b0000; /* Darker red for danger */
-            border-radius: 5px;
-            color: #ecf0f1; /* Light text */
-            padding: 8px 16px;
-            font-size: 11px;
-            font-weight: bold;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #a00000; /* Slightly lighter on hover */
-        }
-        QPushButton:pressed {
-            background-color: #700000; /* Darker on pressed */
-        }
-        QPushButton:disabled {
-            background-color: #1a1a1a; /* Disabled background */
-            color: #7f8c8d; /* Disabled text */
-        }
+        and disabled states for visual feedback. It applies to a `ModernButton`
+        whose `role` property is set to "danger".
         """
+        return _DANGER_BUTTON_STYLE
 
     @staticmethod
     def get_success_button_style() -> str:
@@ -107,55 +481,20 @@ class AppStyles:
         Returns the stylesheet for success/folder action buttons.
 
         This style provides a green gradient background with hover, pressed,
-        and disabled states for visual feedback.
-        """
-        return """
-        QPushButton {
-            background-color: #006400; /* Darker green for success */
-            border-radius: 5px;
-            color: #ecf0f1; /* Light text */
-            padding: 8px 16px;
-            font-size: 11px;
-            font-weight: bold;
-            border: none;
-        }
-        QPushButton:hover {
-            background-color: #008000; /* Slightly lighter on hover */
-        }
-        QPushButton:pressed {
-            background-color: #004d00; /* Darker on pressed */
-        }
-        QPushButton:disabled {
-            background-color: #1a1a1a; /* Disabled background */
-            color: #7f8c8d; /* Disabled text */
-        }
+        and disabled states for visual feedback. It applies to a `ModernButton`
+        whose `role` property is set to "success".
         """
+        return _SUCCESS_BUTTON_STYLE
 
     @staticmethod
     def get_group_style() -> str:
         """
-        Returns the stylesheet for QGroupBox widgets.
+        Returns the stylesheet for the QGroupBox sections of the left panel.
 
         This style applies rounded borders, a bold title, and a white background.
+        A single rule scoped to the panel covers every group box inside it.
         """
-        return """
-        QGroupBox {
-            font-weight: bold;
-            font-size: 15px;
-            color: #ecf0f1; /* Light text for title */
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            background-color: #1a1a1a; /* Black background */
-            margin-top: 5px;
-            padding-top: 5px; 
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 15px;
-            padding: 0 10px 0 10px;
-            background-color: #1a1a1a; /* Match groupbox background */
-        }
-        """
+        return _GROUP_STYLE
 
     @staticmethod
     def get_input_style() -> str:
@@ -164,24 +503,7 @@ class AppStyles:
 
         This style provides rounded borders, padding, and a distinct focus state.
         """
-        return """
-        QLineEdit {
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            padding: 8px 12px;
-            font-size: 13px;
-            background-color: #222222; /* Black input background */
-            color: #ecf0f1; /* Light text */
-            min-height: 20px;
-        }
-        QLineEdit:focus {
-            border-color: #667eea; /* Accent color on focus */
-            outline: none;
-        }
-        QLineEdit::placeholder {
-            color: #95a5a6; /* Placeholder color */
-        }
-        """
+        return _INPUT_STYLE
 
     @staticmethod
     def get_checkbox_style() -> str:
@@ -191,29 +513,7 @@ class AppStyles:
         This style customizes the appearance of the checkbox indicator
         for unchecked, checked, and hover states.
         """
-        return """
-        QCheckBox {
-            font-size: 13px;
-            color: #ecf0f1; /* Light text */
-        }
-        QCheckBox::indicator {
-            width: 12px;
-            height: 12px;
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 3px;
-            background-color: #222222; /* Black background */
-        }
-        QCheckBox::indicator:unchecked {
-            background-color: #222222;
-        }
-        QCheckBox::indicator:checked {
-            background-color: #667eea; /* Accent color when checked */
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTAiIHZpZXdCb3g9IjAgMCAxMiAxMCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEwIDJMNC41IDhMMiA1LjUiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPg==);
-        }
-        QCheckBox::indicator:hover {
-            border-color: #667eea; /* Accent color on hover */
-        }
-        """
+        return _CHECKBOX_STYLE
 
     @staticmethod
     def get_tab_style() -> str:
@@ -223,87 +523,35 @@ class AppStyles:
         This style applies rounded corners to the tab pane and customizes
         the appearance of individual tabs for selected and hover states.
         """
-        return """
-        QTabWidget::pane {
-            border: 1px solid #333333;
-            border-radius: 5px;
-            background-color: #1a1a1a;
-            padding: 15px;
-            min-width: 300px; /* Reasonable minimum width */
-        }
-        QTabBar::tab {
-            background: #222222;
-            border: 1px solid #333333;
-            padding: 8px 15px;
-            font-size: 12px;
-            font-weight: bold;
-            color: #ecf0f1;
-            text-align: center;
-            white-space: nowrap;
-        }
-        QTabBar::tab:selected {
-            background: #1a1a1a; /* Main background color when selected */
-            border-bottom-color: #1a1a1a; /* Hide bottom border */
-            color: #667eea; /* Accent color for selected tab */
-        }
-        QTabBar::tab:hover:!selected {
-            background: #333333; /* Slightly lighter on hover */
-        }
-        """
+        return _TAB_STYLE
 
     @staticmethod
     def get_list_style() -> str:
         """
-        Returns the stylesheet for QListWidget components.
+        Returns the stylesheet for the download queue QListView.
 
         This style provides rounded borders, padding, and distinct
         selected and hover states for list items.
         """
-        return """
-        QListWidget {
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            background-color: #1a1a1a; /* Black background */
-            font-size: 13px;
-            padding: 5px;
-            color: #ecf0f1; /* Light text */
-        }
-        QListWidget::item {
-            padding: 8px 5px;
-            border-bottom: 1px solid #333333; /* Darker separator */
-            border-radius: 3px;
-            margin: 1px 0;
-        }
-        QListWidget::item:selected {
-            background-color: #667eea; /* Accent color when selected */
-            color: #ffffff;
-            border: none;
-        }
-        QListWidget::item:hover {
-            background-color: #222222; /* Slightly lighter on hover */
-        }
-        """
+        return _LIST_STYLE
 
     @staticmethod
     def get_text_style() -> str:
         """
-        Returns the stylesheet for QTextEdit widgets.
+        Returns the stylesheet for the QPlainTextEdit results log.
 
         This style applies rounded borders, padding, and a monospace font
         for displaying text content.
         """
-        return """
-        QTextEdit {
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            background-color: #222222; /* Black background */
-            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-            font-size: 12px;
-            padding: 10px;
-            color: #ecf0f1; /* Light text */
-            line-height: 1.4;
-        }
+        return _TEXT_STYLE
+
+    @staticmethod
+    def get_label_style() -> str:
         """
+        Returns the stylesheet for the title, subtitle, tab header and
+        progress labels, matched by their object names.
+        """
+        return _LABEL_STYLE
 
     @staticmethod
     def get_combo_box_style() -> str:
@@ -313,48 +561,23 @@ class AppStyles:
         This style provides rounded borders, padding, and customizes
         the dropdown arrow and item view appearance.
         """
-        return """
-        QComboBox {
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            padding: 8px 12px;
-            font-size: 13px;
-            background-color: #222222; /* Black background */
-            color: #ecf0f1; /* Light text */
-            min-height: 20px;
-        }
-        QComboBox:focus {
-            border-color: #667eea; /* Accent color on focus */
-            outline: none;
-        }
-        QComboBox::drop-down {
-            border: none;
-        }
-        QComboBox::down-arrow {
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTQgNkw4IDEwTDEyIDYiIHN0cm9rZT0iI2VjZjBmMSIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiIHN0cm9rZS1saW5lam9pbj0icm91bmQiLz4KPC9zdmc+); /* Light arrow */
-            width: 16px;
-            height: 16px;
-            margin-right: 10px;
-        }
-        QComboBox QAbstractItemView {
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 5px;
-            background-color: #222222; /* Black background */
-            color: #ecf0f1; /* Light text */
-            selection-background-color: #667eea; /* Accent color on selection */
-        }
-        """
+        return _COMBO_BOX_STYLE
 
-    @staticmethod
-    def create_app_icon_pixmap() -> QPixmap:
+    @classmethod
+    def create_app_icon_pixmap(cls) -> QPixmap:
         """
         Programmatically creates a QPixmap representing the application icon.
 
-        The icon is a stylized camera graphic with a gradient background.
+        The icon is a stylized camera graphic with a gradient background. It is
+        painted on the first call (a QApplication must exist by then) and the same
+        implicitly shared pixmap is returned afterwards.
 
         Returns:
             QPixmap: The generated application icon pixmap.
         """
+        if cls._app_icon_pixmap is not None:
+            return cls._app_icon_pixmap
+
         pixmap = QPixmap(64, 64)
         pixmap.fill(QColor("#667eea"))  # Background color
 
@@ -375,6 +598,7 @@ class AppStyles:
         painter.drawEllipse(26, 34, 12, 12)
 
         painter.end()
+        cls._app_icon_pixmap = pixmap
         return pixmap
 
     @staticmethod
@@ -383,18 +607,6 @@ class AppStyles:
         Returns the stylesheet for QProgressBar widgets.
 
         This style provides a modern, rounded progress bar with a gradient fill.
+        It applies to every `ModernProgressBar`.
         """
-        return """
-        QProgressBar {
-            border: 1px solid #333333; /* Darker border */
-            border-radius: 8px;
-            background-color: #222222; /* Black background */
-            text-align: center;
-            color: #ecf0f1; /* Light text */
-            font-weight: bold;
-        }
-        QProgressBar::chunk {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #667eea, stop:1 #764ba2); /* Accent gradient */
-            border-radius: 7px;
-        }
-        """
+        return _PROGRESS_STYLE
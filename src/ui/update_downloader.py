@@ -0,0 +1,37 @@
+import os
+
+import requests
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.updater import YT_DLP_PATH
+from src.utils.bin_checker import download_file, YT_DLP_DOWNLOAD_URL
+
+
+class UpdateDownloader(QThread):
+    """
+    Downloads yt-dlp.exe to the 'bin' directory off the GUI thread.
+
+    Emits `progress_updated` with the download percentage and
+    `download_finished` with a success flag and an error message.
+    """
+
+    progress_updated = pyqtSignal(int)
+    download_finished = pyqtSignal(bool, str)
+
+    def run(self):
+        try:
+            # Ensure the bin directory exists
+            os.makedirs(os.path.dirname(YT_DLP_PATH), exist_ok=True)
+
+            download_file(
+                YT_DLP_DOWNLOAD_URL,
+                YT_DLP_PATH,
+                lambda percent, _message: self.progress_updated.emit(percent),
+            )
+            self.download_finished.emit(True, "")
+        except requests.exceptions.RequestException as e:
+            self.download_finished.emit(False, f"Failed to download yt-dlp update: {e}")
+        except Exception as e:
+            self.download_finished.emit(
+                False, f"An unexpected error occurred during update: {e}"
+            )
@@ -1,46 +1,192 @@
+import json
+import logging
+import os
 import subprocess
+import sys
 import requests
-import os
-from PyQt6.QtWidgets import QProgressDialog, QApplication, QMessageBox
-from PyQt6.QtCore import Qt
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import time
+from pathlib import Path
+from packaging.version import Version, InvalidVersion
+
+from src.utils.bin_checker import YT_DLP_DOWNLOAD_URL
+
+logger = logging.getLogger(__name__)
+
+LATEST_RELEASE_URL = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
+
+# Pooled session for the GitHub API. requests already negotiates gzip (and br
+# when a brotli decoder is installed), so only the API media type is added.
+_SESSION = requests.Session()
+_SESSION.headers["Accept"] = "application/vnd.github+json"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+# Last seen release tag and ETag, so startup checks can skip or shrink the request
+UPDATE_CACHE_FILE = Path.home() / ".config" / "insta-downloader" / "update_cache.json"
+UPDATE_CACHE_TTL = 6 * 60 * 60  # seconds
+
+YT_DLP_PATH = os.path.join("bin", "yt-dlp.exe")
+
+# Keep Windows from creating (and tearing down) a console for yt-dlp.exe
+_CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
+
+# (mtime, version) of the last `yt-dlp.exe --version` run
+_current_version_cache = None
 
 
 def get_current_version() -> str | None:
     """
     Retrieves the current version of the yt-dlp executable.
 
-    Executes `yt-dlp.exe --version` and parses the output.
+    Executes `yt-dlp.exe --version` and parses the output. The result is
+    cached against the executable's modification time, so the process is only
+    spawned again after the binary has been replaced.
 
     Returns:
         str | None: The current version string if successful, otherwise None.
     """
+    global _current_version_cache
+
+    try:
+        mtime = os.path.getmtime(YT_DLP_PATH)
+    except OSError:
+        return None
+
+    if _current_version_cache and _current_version_cache[0] == mtime:
+        return _current_version_cache[1]
+
     try:
         result = subprocess.run(
-            ["bin/yt-dlp.exe", "--version"],
+            [YT_DLP_PATH, "--version"],
             capture_output=True,
             text=True,
             check=True,
             encoding="utf-8",
+            creationflags=_CREATE_NO_WINDOW,
+            timeout=5,
         )
-        return result.stdout.strip()
-    except (FileNotFoundError, subprocess.CalledProcessError):
+        version = result.stdout.strip()
+        _current_version_cache = (mtime, version)
+        return version
+    except (
+        FileNotFoundError,
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+    ):
         # Log the error if a proper logging mechanism is in place
         return None
 
 
+def _load_update_cache() -> dict:
+    """
+    Reads the cached release lookup for the GitHub endpoint.
+
+    Returns:
+        dict: The cached entry (`etag`, `last_modified`, `tag_name`,
+              `checked_at`), or an empty dict if there is no usable cache.
+    """
+    try:
+        with open(UPDATE_CACHE_FILE, "r", encoding="utf-8") as f:
+            entry = json.load(f).get(LATEST_RELEASE_URL, {})
+        return entry if isinstance(entry, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_update_cache(entry: dict):
+    """
+    Stores the release lookup for the GitHub endpoint in the cache file.
+
+    Args:
+        entry (dict): The `etag`, `last_modified`, `tag_name` and `checked_at`
+                      values to store.
+    """
+    try:
+        try:
+            with open(UPDATE_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except Exception:
+            cache = {}
+        cache[LATEST_RELEASE_URL] = entry
+        UPDATE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(UPDATE_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+    except Exception:
+        # The cache is only an optimization; ignore write failures
+        pass
+
+
+def _get_asset_last_modified() -> str | None:
+    """
+    Reads the `Last-Modified` header of the latest yt-dlp.exe release asset.
+
+    Returns:
+        str | None: The header value, or None if the HEAD request fails or the
+                    header is missing.
+    """
+    try:
+        response = _SESSION.head(
+            YT_DLP_DOWNLOAD_URL,
+            headers={"Accept": "*/*"},
+            allow_redirects=True,
+            timeout=5,
+        )
+        response.raise_for_status()
+        return response.headers.get("Last-Modified")
+    except requests.exceptions.RequestException:
+        return None
+
+
 def get_latest_version() -> str | None:
     """
     Fetches the latest available version of yt-dlp from its GitHub releases.
 
+    A result younger than `UPDATE_CACHE_TTL` is returned without a request.
+    Otherwise the request carries the cached ETag, and GitHub answers with an
+    empty `304 Not Modified` when the release has not changed. When no ETag
+    is cached (e.g. a proxy strips it), a HEAD of the release asset is tried
+    first, and an unchanged `Last-Modified` skips the API request entirely.
+
     Returns:
         str | None: The latest version tag name if successful, otherwise None.
     """
+    cached = _load_update_cache()
+    cached_tag = cached.get("tag_name")
+    if cached_tag and time.time() - cached.get("checked_at", 0) < UPDATE_CACHE_TTL:
+        return cached_tag
+
+    last_modified = cached.get("last_modified")
+    if not cached.get("etag"):
+        last_modified = _get_asset_last_modified()
+        if cached_tag and last_modified and last_modified == cached.get(
+            "last_modified"
+        ):
+            _save_update_cache({**cached, "checked_at": time.time()})
+            return cached_tag
+
+    headers = {}
+    if cached_tag and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
     try:
-        response = requests.get(
-            "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest", timeout=10
-        )
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        return response.json()["tag_name"]
+        response = _SESSION.get(LATEST_RELEASE_URL, headers=headers, timeout=10)
+        if response.status_code == 304 and cached_tag:
+            tag_name = cached_tag
+            etag = cached.get("etag")
+        else:
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            tag_name = response.json()["tag_name"]
+            etag = response.headers.get("ETag")
     except requests.exceptions.RequestException:
         # Log the error if a proper logging mechanism is in place
         return None
@@ -48,74 +194,113 @@ def get_latest_version() -> str | None:
         # Log the error if 'tag_name' is not found in the JSON response
         return None
 
+    _save_update_cache(
+        {
+            "etag": etag,
+            "last_modified": last_modified,
+            "tag_name": tag_name,
+            "checked_at": time.time(),
+        }
+    )
+    return tag_name
+
+
+# Keeps the running download thread alive until it finishes
+_update_thread = None
+
 
 def download_latest_version():
     """
     Downloads the latest yt-dlp.exe to the 'bin' directory.
 
-    Displays a QProgressDialog to show download progress.
-    Handles potential network errors during download.
+    Displays a QProgressDialog to show download progress while an
+    `UpdateDownloader` thread fetches the file, so the GUI thread keeps
+    running its own event loop instead of pumping events from the download
+    loop. Reports the result in a message box once the thread finishes.
     """
+    # Qt is imported here so the version checks above stay usable headless
+    from PyQt6.QtWidgets import QProgressDialog, QMessageBox
+    from PyQt6.QtCore import Qt
+    from src.ui.update_downloader import UpdateDownloader
+
+    global _update_thread
+
     progress = QProgressDialog("Downloading update...", "Cancel", 0, 100)
     progress.setWindowModality(Qt.WindowModality.WindowModal)
     progress.setAutoClose(False)  # Keep dialog open until explicitly closed
     progress.setCancelButton(None)  # No cancel button for critical updates
     progress.show()
 
-    try:
-        response = requests.get(
-            "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe",
-            stream=True,
-            timeout=300,  # 5 minutes timeout for large files
-        )
-        response.raise_for_status()
+    def on_finished(success, error):
+        global _current_version_cache
+        progress.close()
+        if success:
+            _current_version_cache = None
+            QMessageBox.information(
+                None,
+                "Update Complete",
+                "yt-dlp has been updated to the latest version.",
+            )
+        else:
+            QMessageBox.critical(None, "Download Error", error)
 
-        total_size = int(response.headers.get("content-length", 0))
-        bytes_downloaded = 0
-
-        # Ensure the bin directory exists
-        os.makedirs("bin", exist_ok=True)
-        yt_dlp_path = os.path.join("bin", "yt-dlp.exe")
-
-        with open(yt_dlp_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):  # Increased chunk size
-                if (
-                    progress.wasCanceled()
-                ):  # Check if user cancelled (if button re-enabled)
-                    break
-                if chunk:
-                    f.write(chunk)
-                    bytes_downloaded += len(chunk)
-                    if total_size > 0:
-                        progress.setValue(int(100 * bytes_downloaded / total_size))
-                    QApplication.processEvents()  # Keep UI responsive
-
-        progress.setValue(100)
-        QMessageBox.information(
-            None,
-            "Update Complete",
-            "yt-dlp has been updated to the latest version.",
-        )
-    except requests.exceptions.RequestException as e:
-        QMessageBox.critical(
-            None, "Download Error", f"Failed to download yt-dlp update: {e}"
-        )
-    except Exception as e:
-        QMessageBox.critical(
-            None, "Error", f"An unexpected error occurred during update: {e}"
+    def on_thread_finished():
+        # download_finished is emitted from inside run(), so the reference is
+        # only dropped once the thread has really stopped; Python owns the
+        # QThread, so there is no deleteLater as well
+        global _update_thread
+        _update_thread = None
+
+    thread = UpdateDownloader()
+    thread.progress_updated.connect(progress.setValue)
+    thread.download_finished.connect(on_finished)
+    thread.finished.connect(on_thread_finished)
+    _update_thread = thread
+    thread.start()
+
+
+def is_newer_version(current_version: str, latest_version: str) -> bool:
+    """
+    Compares two yt-dlp version strings.
+
+    Versions are compared numerically (so `2024.12.23.1` is newer than
+    `2024.12.23`), ignoring a leading `v` on either side. Strings that are not
+    valid versions fall back to a plain string comparison.
+
+    Args:
+        current_version (str): The installed version.
+        latest_version (str): The latest released version.
+
+    Returns:
+        bool: True if `latest_version` is newer than `current_version`.
+    """
+    current = current_version.strip().lstrip("vV")
+    latest = latest_version.strip().lstrip("vV")
+    try:
+        return Version(current) < Version(latest)
+    except InvalidVersion:
+        logger.warning(
+            "Could not parse yt-dlp versions %r and %r; comparing as strings",
+            current_version,
+            latest_version,
         )
-    finally:
-        progress.close()
+        return current < latest
 
 
 def check_for_updates():
     """
     Checks for available yt-dlp updates and prompts the user to download if a new version is found.
     """
+    from PyQt6.QtWidgets import QMessageBox
+
     current_version = get_current_version()
     latest_version = get_latest_version()
 
-    if current_version and latest_version and current_version < latest_version:
+    if (
+        current_version
+        and latest_version
+        and is_newer_version(current_version, latest_version)
+    ):
         reply = QMessageBox.question(
             None,
             "Update Available",
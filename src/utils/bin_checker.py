@@ -1,14 +1,37 @@
 import os
 import sys
 import platform
-import urllib.request
 import zipfile
 import shutil
+import hashlib
+import re
+import tempfile
 import logging
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Read downloads in 1 MiB blocks to keep per-chunk Python overhead low
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
+# The FFmpeg archive is held in memory up to this size before spilling to disk
+FFMPEG_SPOOL_SIZE = 256 * 1024 * 1024
+
+YT_DLP_DOWNLOAD_URL = (
+    "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
+)
+
+# Whisper model URLs contain the expected SHA-256 of the file
+_MODEL_SHA256_RE = re.compile(r"/models/([0-9a-f]{64})/")
+
+# Shared session so the downloads reuse TCP/TLS connections to GitHub
+_SESSION = requests.Session()
+
+
+@lru_cache(maxsize=None)
 def is_frozen():
     """Check if the application is running as a frozen executable (EXE)"""
     return getattr(sys, "frozen", False)
@@ -24,6 +47,7 @@ def is_windows():
     return platform.system() == "Windows"
 
 
+@lru_cache(maxsize=None)
 def get_bin_dir():
     """Get the path to the bin directory based on execution context"""
     if is_frozen():
@@ -34,6 +58,11 @@ def get_bin_dir():
         return os.path.join(os.path.dirname(__file__), "..", "bin")
 
 
+# These paths never change while the process runs, so resolve them once
+BIN_DIR = get_bin_dir()
+WHISPER_DIR = os.path.join(os.path.dirname(BIN_DIR), "whisper")
+
+
 def get_yt_dlp_command():
     """Get the appropriate yt-dlp command for the current platform"""
     if is_linux():
@@ -41,8 +70,7 @@ def get_yt_dlp_command():
         return "yt-dlp"
     else:
         # On Windows, use local binary
-        bin_dir = get_bin_dir()
-        return os.path.join(bin_dir, "yt-dlp.exe")
+        return os.path.join(BIN_DIR, "yt-dlp.exe")
 
 
 def get_ffmpeg_command():
@@ -52,33 +80,80 @@ def get_ffmpeg_command():
         return "ffmpeg"
     else:
         # On Windows, use local binary
-        bin_dir = get_bin_dir()
-        return os.path.join(bin_dir, "ffmpeg.exe")
+        return os.path.join(BIN_DIR, "ffmpeg.exe")
+
+
+def download_to_fileobj(
+    url, fileobj, progress_callback=None, message="", scale=100, hasher=None
+):
+    """Stream a URL into an open binary file, reporting progress from 0 to scale.
+
+    If a hashlib object is given it is updated with every chunk as it is
+    written. Raises requests exceptions on network or HTTP errors.
+    """
+    with _SESSION.get(url, stream=True, timeout=300) as response:
+        response.raise_for_status()
+        total = int(response.headers.get("content-length") or 0)
+        downloaded = 0
+        last_percent = -1
+        for buf in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            fileobj.write(buf)
+            if hasher is not None:
+                hasher.update(buf)
+            downloaded += len(buf)
+            if progress_callback:
+                percent = min(
+                    scale, int(downloaded * scale / total) if total > 0 else 0
+                )
+                # Skip the callback when the reported value has not changed
+                if percent != last_percent:
+                    progress_callback(percent, message)
+                    last_percent = percent
+
+
+def download_file(
+    url, dest_path, progress_callback=None, message="", scale=100, sha256=None
+):
+    """Stream a URL to dest_path, reporting progress from 0 to scale.
+
+    Shared by the dependency downloads and the yt-dlp updater. The data is
+    written to a ".part" file that is synced once and renamed into place, so
+    an interrupted download never leaves a truncated dest_path behind. When
+    sha256 is given the digest is computed during the download. Raises
+    requests exceptions on network or HTTP errors and IOError on a hash
+    mismatch.
+    """
+    part_path = dest_path + ".part"
+    hasher = hashlib.sha256() if sha256 else None
+    try:
+        with open(part_path, "wb") as f:
+            download_to_fileobj(url, f, progress_callback, message, scale, hasher)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if hasher is not None and hasher.hexdigest() != sha256.lower():
+            raise IOError(f"SHA-256 mismatch for {os.path.basename(dest_path)}")
+
+        os.replace(part_path, dest_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
 
 
 def download_yt_dlp(progress_callback=None):
     """Download yt-dlp.exe to the bin directory"""
-    bin_dir = get_bin_dir()
-    os.makedirs(bin_dir, exist_ok=True)
-    url = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
-    dest_path = os.path.join(bin_dir, "yt-dlp.exe")
+    os.makedirs(BIN_DIR, exist_ok=True)
+    url = YT_DLP_DOWNLOAD_URL
+    dest_path = os.path.join(BIN_DIR, "yt-dlp.exe")
 
     try:
         if progress_callback:
             progress_callback(0, "Downloading yt-dlp.exe...")
 
         logger.info("Downloading yt-dlp.exe...")
-        urllib.request.urlretrieve(
-            url,
-            dest_path,
-            reporthook=lambda count, size, total: (
-                progress_callback(
-                    min(100, int(count * size * 100 / total if total > 0 else 0)),
-                    "Downloading yt-dlp.exe...",
-                )
-                if progress_callback
-                else None
-            ),
+        download_file(
+            url, dest_path, progress_callback, "Downloading yt-dlp.exe..."
         )
 
         if progress_callback:
@@ -93,48 +168,57 @@ def download_yt_dlp(progress_callback=None):
 
 
 def download_ffmpeg(progress_callback=None):
-    """Download and extract ffmpeg to the bin directory"""
-    bin_dir = get_bin_dir()
-    os.makedirs(bin_dir, exist_ok=True)
-    temp_dir = os.path.join(bin_dir, "temp_ffmpeg")
-    os.makedirs(temp_dir, exist_ok=True)
+    """Download ffmpeg and extract ffmpeg.exe straight into the bin directory"""
+    os.makedirs(BIN_DIR, exist_ok=True)
 
     # Download the latest FFmpeg build
     url = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
-    zip_path = os.path.join(temp_dir, "ffmpeg.zip")
 
     try:
         if progress_callback:
             progress_callback(0, "Downloading FFmpeg...")
         logger.info("Downloading FFmpeg...")
-        urllib.request.urlretrieve(
-            url,
-            zip_path,
-            reporthook=lambda count, size, total: (
-                progress_callback(
-                    min(50, int(count * size * 50 / total if total > 0 else 0)),
-                    "Downloading FFmpeg...",
-                )
-                if progress_callback
-                else None
-            ),
-        )
 
-        if progress_callback:
-            progress_callback(50, "Extracting FFmpeg...")
-        logger.info("Extracting FFmpeg...")
-
-        # Extract FFmpeg executable
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            # Find ffmpeg.exe in the zip file
-            for file in zip_ref.namelist():
-                if file.endswith("ffmpeg.exe") and "bin" in file:
-                    zip_ref.extract(file, temp_dir)
-                    extracted_path = os.path.join(temp_dir, file)
+        # Keep the archive in memory (spilling to disk only if very large) and
+        # write just ffmpeg.exe out of it, instead of saving and re-reading a zip
+        with tempfile.SpooledTemporaryFile(max_size=FFMPEG_SPOOL_SIZE) as archive:
+            download_to_fileobj(
+                url, archive, progress_callback, "Downloading FFmpeg...", scale=50
+            )
 
-                    # Move to bin directory
-                    shutil.move(extracted_path, os.path.join(bin_dir, "ffmpeg.exe"))
-                    break
+            if progress_callback:
+                progress_callback(50, "Extracting FFmpeg...")
+            logger.info("Extracting FFmpeg...")
+
+            archive.seek(0)
+            with zipfile.ZipFile(archive) as zip_ref:
+                # Find ffmpeg.exe in the zip file
+                member = next(
+                    (
+                        name
+                        for name in zip_ref.namelist()
+                        if name.endswith("ffmpeg.exe") and "bin" in name
+                    ),
+                    None,
+                )
+                if member is None:
+                    raise FileNotFoundError("ffmpeg.exe not found in the archive")
+
+                # Extract to a ".part" file and rename it into place, so a
+                # failed copy never leaves a truncated ffmpeg.exe behind for
+                # ensure_ffmpeg to accept
+                dest_path = os.path.join(BIN_DIR, "ffmpeg.exe")
+                part_path = dest_path + ".part"
+                try:
+                    with zip_ref.open(member) as src, open(part_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+                        dst.flush()
+                        os.fsync(dst.fileno())
+                    os.replace(part_path, dest_path)
+                except BaseException:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    raise
 
         if progress_callback:
             progress_callback(100, "FFmpeg downloaded successfully")
@@ -145,10 +229,6 @@ def download_ffmpeg(progress_callback=None):
         if progress_callback:
             progress_callback(0, f"Failed to download FFmpeg: {e}")
         return False
-    finally:
-        # Clean up temporary directory
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
 
 
 def download_whisper_model(progress_callback=None):
@@ -156,8 +236,7 @@ def download_whisper_model(progress_callback=None):
     if not is_frozen():
         return True
 
-    base_dir = os.path.dirname(get_bin_dir())
-    whisper_dir = os.path.join(base_dir, "whisper")
+    whisper_dir = WHISPER_DIR
     assets_dir = os.path.join(whisper_dir, "assets")
 
     # Create directories if needed
@@ -185,17 +264,14 @@ def download_whisper_model(progress_callback=None):
                     int(i / len(model_files) * 100), f"Downloading {file}..."
                 )
 
-            urllib.request.urlretrieve(
+            # The model URL embeds the file's SHA-256; verify it while streaming
+            match = _MODEL_SHA256_RE.search(url)
+            download_file(
                 url,
                 file_path,
-                reporthook=lambda count, size, total: (
-                    progress_callback(
-                        min(100, int(count * size * 100 / total if total > 0 else 0)),
-                        f"Downloading {file}...",
-                    )
-                    if progress_callback
-                    else None
-                ),
+                progress_callback,
+                f"Downloading {file}...",
+                sha256=match.group(1) if match else None,
             )
 
         if progress_callback:
@@ -214,9 +290,7 @@ def ensure_whisper_model(progress_callback=None):
     if not is_frozen():
         return True
 
-    base_dir = os.path.dirname(get_bin_dir())
-    whisper_dir = os.path.join(base_dir, "whisper")
-    model_path = os.path.join(whisper_dir, "base.pt")
+    model_path = os.path.join(WHISPER_DIR, "base.pt")
 
     if not os.path.exists(model_path):
         return download_whisper_model(progress_callback)
@@ -225,8 +299,7 @@ def ensure_whisper_model(progress_callback=None):
 
 def ensure_yt_dlp(progress_callback=None):
     """Ensure yt-dlp.exe exists in bin directory, download if needed and in frozen state"""
-    bin_dir = get_bin_dir()
-    yt_dlp_path = os.path.join(bin_dir, "yt-dlp.exe")
+    yt_dlp_path = os.path.join(BIN_DIR, "yt-dlp.exe")
 
     if not os.path.exists(yt_dlp_path) and is_frozen():
         return download_yt_dlp(progress_callback)
@@ -235,9 +308,48 @@ def ensure_yt_dlp(progress_callback=None):
 
 def ensure_ffmpeg(progress_callback=None):
     """Ensure ffmpeg.exe exists in bin directory, download if needed and in frozen state"""
-    bin_dir = get_bin_dir()
-    ffmpeg_path = os.path.join(bin_dir, "ffmpeg.exe")
+    ffmpeg_path = os.path.join(BIN_DIR, "ffmpeg.exe")
 
     if not os.path.exists(ffmpeg_path) and is_frozen():
         return download_ffmpeg(progress_callback)
     return True
+
+
+def ensure_all_binaries(progress_callback=None, yt_dlp=True, ffmpeg=True, whisper=True):
+    """Ensure the selected dependencies exist, downloading missing ones concurrently.
+
+    The downloads are independent, so they run in a thread pool and the total
+    wait is that of the slowest one. Progress from each task is averaged into a
+    single value that never goes backwards.
+    """
+    checks = []
+    if yt_dlp:
+        checks.append(ensure_yt_dlp)
+    if ffmpeg:
+        checks.append(ensure_ffmpeg)
+    if whisper:
+        checks.append(ensure_whisper_model)
+    if not checks:
+        return True
+
+    lock = threading.Lock()
+    task_progress = [0] * len(checks)
+    reported = [0]
+
+    def make_callback(index):
+        def callback(value, text):
+            if not progress_callback:
+                return
+            with lock:
+                task_progress[index] = value
+                overall = max(reported[0], sum(task_progress) // len(checks))
+                reported[0] = overall
+                progress_callback(overall, text)
+
+        return callback
+
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [
+            executor.submit(check, make_callback(i)) for i, check in enumerate(checks)
+        ]
+        return all(future.result() for future in futures)
@@ -2,7 +2,7 @@
 This module provides utility functions for lazy importing of optional dependencies.
 
 Each function attempts to import a specific package only when it is first needed,
-and caches the imported module or class in a global variable for future use.
+and the imported module or class is cached for future use.
 If the required package is not installed, an ImportError with a descriptive message is raised,
 guiding the user on which dependency is missing.
 
@@ -10,12 +10,37 @@ This approach optimizes application startup time and memory usage by avoiding
 loading heavy or non-essential libraries until they are explicitly required.
 """
 
-# Global variables to cache lazy-loaded modules
-_instaloader = None
-_moviepy = None
-_whisper = None
-_requests = None
-_PIL = None
+from functools import lru_cache
+from importlib import import_module
+
+
+@lru_cache(maxsize=None)
+def _lazy(module_name, pip_name, attr=None, purpose="this functionality"):
+    """
+    Imports a module (or one of its attributes) once and caches the result.
+
+    Failed imports are not cached, so a later call retries the import.
+
+    Args:
+        module_name (str): The dotted module path to import.
+        pip_name (str): The package name to suggest in the error message.
+        attr (str, optional): An attribute of the module to return instead.
+        purpose (str): What the package is needed for, used in the error message.
+
+    Raises:
+        ImportError: If the package is not installed.
+
+    Returns:
+        The imported module, or the requested attribute of it.
+    """
+    try:
+        module = import_module(module_name)
+        return getattr(module, attr) if attr else module
+    except ImportError as e:
+        raise ImportError(
+            f"The '{pip_name}' package is required for {purpose}. "
+            f"Please install it using: pip install {pip_name}"
+        ) from e
 
 
 def lazy_import_requests():
@@ -28,18 +53,7 @@ def lazy_import_requests():
     Returns:
         module: The imported 'requests' module.
     """
-    global _requests
-    if _requests is None:
-        try:
-            import requests
-
-            _requests = requests
-        except ImportError as e:
-            raise ImportError(
-                "The 'requests' package is required for this functionality. "
-                "Please install it using: pip install requests"
-            ) from e
-    return _requests
+    return _lazy("requests", "requests")
 
 
 def lazy_import_instaloader():
@@ -52,18 +66,7 @@ def lazy_import_instaloader():
     Returns:
         module: The imported 'instaloader' module.
     """
-    global _instaloader
-    if _instaloader is None:
-        try:
-            import instaloader
-
-            _instaloader = instaloader
-        except ImportError as e:
-            raise ImportError(
-                "The 'instaloader' package is required for this functionality. "
-                "Please install it using: pip install instaloader"
-            ) from e
-    return _instaloader
+    return _lazy("instaloader", "instaloader")
 
 
 def lazy_import_moviepy():
@@ -76,18 +79,7 @@ def lazy_import_moviepy():
     Returns:
         class: The 'VideoFileClip' class.
     """
-    global _moviepy
-    if _moviepy is None:
-        try:
-            from moviepy.editor import VideoFileClip
-
-            _moviepy = VideoFileClip
-        except ImportError as e:
-            raise ImportError(
-                "The 'moviepy' package is required for audio extraction. "
-                "Please install it using: pip install moviepy"
-            ) from e
-    return _moviepy
+    return _lazy("moviepy.editor", "moviepy", "VideoFileClip", "audio extraction")
 
 
 def lazy_import_whisper():
@@ -100,18 +92,49 @@ def lazy_import_whisper():
     Returns:
         function: The whisper.load_model function.
     """
-    global _whisper
-    if _whisper is None:
-        try:
-            import whisper
+    return _lazy("whisper", "openai-whisper", "load_model", "transcription")
+
+
+def lazy_import_whisper_audio():
+    """
+    Lazily imports whisper's audio decoding helper.
+
+    Raises:
+        ImportError: If the 'openai-whisper' package is not installed.
 
-            _whisper = whisper.load_model
-        except ImportError as e:
-            raise ImportError(
-                "The 'openai-whisper' package is required for transcription. "
-                "Please install it using: pip install openai-whisper"
-            ) from e
-    return _whisper
+    Returns:
+        function: The whisper.audio.load_audio function.
+    """
+    return _lazy("whisper.audio", "openai-whisper", "load_audio", "transcription")
+
+
+def lazy_import_faster_whisper():
+    """
+    Lazily imports the 'WhisperModel' class from the 'faster_whisper' library.
+
+    Raises:
+        ImportError: If the 'faster-whisper' package is not installed.
+
+    Returns:
+        class: The 'faster_whisper.WhisperModel' class.
+    """
+    return _lazy("faster_whisper", "faster-whisper", "WhisperModel", "transcription")
+
+
+def lazy_import_faster_whisper_batched():
+    """
+    Lazily imports the 'BatchedInferencePipeline' class from the 'faster_whisper' library.
+
+    Raises:
+        ImportError: If the 'faster-whisper' package is not installed.
+        AttributeError: If the installed 'faster-whisper' predates batched inference.
+
+    Returns:
+        class: The 'faster_whisper.BatchedInferencePipeline' class.
+    """
+    return _lazy(
+        "faster_whisper", "faster-whisper", "BatchedInferencePipeline", "transcription"
+    )
 
 
 def lazy_import_pil():
@@ -124,15 +147,4 @@ def lazy_import_pil():
     Returns:
         class: The 'PIL.Image' class.
     """
-    global _PIL
-    if _PIL is None:
-        try:
-            from PIL import Image
-
-            _PIL = Image
-        except ImportError as e:
-            raise ImportError(
-                "The 'Pillow' package is required for image processing. "
-                "Please install it using: pip install Pillow"
-            ) from e
-    return _PIL
+    return _lazy("PIL.Image", "Pillow", purpose="image processing")
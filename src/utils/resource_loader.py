@@ -1,15 +1,18 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import cast, Any
 
 
+@lru_cache(maxsize=None)
 def get_base_path() -> Path:
     """
     Determines the base path for loading application resources.
 
     This function intelligently identifies the root directory for resources,
     whether the application is running from source code or as a frozen
-    executable (e.g., bundled by PyInstaller).
+    executable (e.g., bundled by PyInstaller). The result does not change while
+    the process runs, so it is computed once and cached.
 
     Returns:
         Path: The base directory where resources are located.
@@ -27,6 +30,7 @@ def get_base_path() -> Path:
         return Path(__file__).resolve().parent.parent
 
 
+@lru_cache(maxsize=256)
 def get_resource_path(relative_path: str) -> Path:
     """
     Constructs the absolute path to a specified resource.
@@ -36,6 +40,9 @@ def get_resource_path(relative_path: str) -> Path:
     2. When running as a PyInstaller one-file executable: Resources are in `sys._MEIPASS`.
     3. When running as a PyInstaller one-folder executable: Resources are alongside the executable.
 
+    Results are cached per `relative_path`, so the lookup (including the
+    existence check for one-file bundles) only runs once for each resource.
+
     Args:
         relative_path (str): The path to the resource relative to the base resource directory
                              (e.g., "bin/yt-dlp.exe", "favicon.ico", "whisper/base.pt").
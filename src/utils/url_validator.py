@@ -1,4 +1,10 @@
-from urllib.parse import urlparse
+import re
+
+# Scheme, Instagram host, optional leading path segments, then a
+# /reel/, /reels/ or /p/ segment followed by a non-empty ID
+_INSTAGRAM_URL_RE = re.compile(
+    r"https?://(?:www\.)?instagram\.com/(?:[^?#]*/)?(?:reels?|p)/[^/?#]+"
+)
 
 
 def is_valid_instagram_url(url: str) -> bool:
@@ -10,42 +16,13 @@ def is_valid_instagram_url(url: str) -> bool:
     2. Path contains '/reel/', '/reels/', or '/p/' followed by an ID
     3. Has a valid reel/post ID after the pattern
 
+    The check is a single match against a precompiled pattern, so no
+    intermediate strings are built while validating.
+
     Args:
         url (str): The URL string to validate.
 
     Returns:
         bool: True if the URL is a valid Instagram Reel/Post URL, False otherwise.
     """
-    try:
-        parsed = urlparse(url)
-        if parsed.netloc not in ["instagram.com", "www.instagram.com"]:
-            return False
-
-        path = parsed.path
-
-        # Check for reel URLs (singular)
-        if "/reel/" in path:
-            parts = path.split("/reel/", 1)
-            if len(parts) < 2 or not parts[1].split("/")[0]:
-                return False
-            return True
-
-        # Check for reels URLs (plural) - alternate format
-        if "/reels/" in path:
-            parts = path.split("/reels/", 1)
-            if len(parts) < 2 or not parts[1].split("/")[0]:
-                return False
-            return True
-
-        # Check for post URLs
-        if "/p/" in path:
-            parts = path.split("/p/", 1)
-            if len(parts) < 2 or not parts[1].split("/")[0]:
-                return False
-            return True
-
-        return False
-    except ValueError:
-        return False
-    except Exception:
-        return False
+    return _INSTAGRAM_URL_RE.match(url) is not None
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import zipfile
+from typing import Iterable, Iterator, Tuple
+
+# Media formats that are already compressed; deflating them again costs CPU
+# without making the archive any smaller
+STORED_SUFFIXES = frozenset({
+    ".mp4", ".mov", ".jpg", ".jpeg", ".png", ".webp",
+    ".m4a", ".mp3", ".aac", ".wav",
+})
+
+# ZipFile.write() copies in 8 KiB reads; large media goes through 1 MiB blocks
+ZIP_COPY_BUFFER_SIZE = 1 << 20
+
+
+def iter_files(root: str) -> Iterator[str]:
+    """
+    Yields the paths of all non-empty regular files below a directory.
+
+    Symlinks are not followed. Each os.DirEntry caches the file type from
+    the directory listing, so this avoids the extra stat() per entry that
+    Path.rglob() followed by is_file() performs.
+
+    Args:
+        root (str): The directory to walk.
+
+    Yields:
+        str: The path of each regular file with a non-zero size.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                # Skip 0-byte leftovers such as lock or aborted temp files
+                if entry.stat(follow_symlinks=False).st_size:
+                    yield entry.path
+            elif entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+
+
+def write_stored_entry(zip_file: zipfile.ZipFile, file_path: str, arcname: str) -> None:
+    """
+    Copies a file into an archive uncompressed, using a large copy buffer.
+
+    Args:
+        zip_file (zipfile.ZipFile): The archive open for writing.
+        file_path (str): The file to add.
+        arcname (str): The name of the entry inside the archive.
+    """
+    zip_info = zipfile.ZipInfo.from_file(file_path, arcname)
+    zip_info.compress_type = zipfile.ZIP_STORED
+    with open(file_path, "rb") as src, zip_file.open(zip_info, "w") as dst:
+        shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER_SIZE)
+
+
+def build_zip(
+    files: Iterable[Tuple[str, str]],
+    texts: Iterable[Tuple[str, str]] = (),
+) -> bytes:
+    """
+    Builds a ZIP archive from files on disk and in-memory text entries.
+
+    Files whose suffix is in STORED_SUFFIXES are stored as-is; everything
+    else is deflated at level 1, which compresses small text files nearly as
+    well as the default level 6 at a fraction of the CPU cost. The archive is
+    built in an anonymous temp file rather than a BytesIO, so only the
+    returned bytes are held in memory instead of both the buffer and its
+    getvalue() copy.
+
+    Args:
+        files (Iterable[Tuple[str, str]]): (file_path, arcname) pairs.
+        texts (Iterable[Tuple[str, str]]): (arcname, text) pairs.
+
+    Returns:
+        bytes: The finished archive.
+    """
+    with tempfile.TemporaryFile() as zip_buffer:
+        with zipfile.ZipFile(
+            zip_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zip_file:
+            for file_path, arcname in files:
+                if os.path.splitext(file_path)[1].lower() in STORED_SUFFIXES:
+                    write_stored_entry(zip_file, file_path, arcname)
+                else:
+                    zip_file.write(file_path, arcname)
+            for arcname, text in texts:
+                zip_file.writestr(arcname, text)
+
+        zip_buffer.seek(0)
+        return zip_buffer.read()
@@ -9,7 +9,6 @@ from streamlit.web import cli as stcli
 import sys
 from pathlib import Path
 import json
-import base64
 
 # Import your existing downloader
 from src.core.downloader import download_media
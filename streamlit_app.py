@@ -12,13 +12,11 @@ License: MIT
 
 import streamlit as st
 import os
-import tempfile
-import zipfile
-import io
 from pathlib import Path
 from typing import List, Dict, Any
 import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 from datetime import datetime
 import warnings
@@ -31,19 +29,75 @@ warnings.filterwarnings("ignore", category=UserWarning)
 from src.core.data_models import ReelItem
 from src.core.session_manager import SessionManager
 from src.utils.url_validator import is_valid_instagram_url
+from src.utils.zip_utils import build_zip, iter_files
 from src.agents import instaloader as instaloader_agent
 from src.agents import yt_dlp as yt_dlp_agent
 from src.core.transcriber import AudioTranscriber
 from src.utils.lazy_imports import lazy_import_instaloader
 
 
+@st.cache_resource
+def get_audio_transcriber() -> AudioTranscriber:
+    """Load the Whisper model once per server process and share it across sessions."""
+    transcriber = AudioTranscriber()
+    transcriber.load_whisper_model()
+    if transcriber.whisper_model is None:
+        # Raising keeps the failed load out of the cache so it is retried
+        raise RuntimeError("Whisper model could not be loaded")
+    return transcriber
+
+
+@st.cache_resource
+def get_transcription_lock() -> threading.Lock:
+    """Lock serialising use of the shared Whisper model across concurrent sessions."""
+    return threading.Lock()
+
+
+@st.cache_resource
+def get_download_executor() -> ThreadPoolExecutor:
+    """Shared worker pool that runs downloads off the Streamlit script thread."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+# A backend that failed this many times within the window is skipped in favour
+# of the other one until the window has passed
+BACKEND_FAILURE_LIMIT = 2
+BACKEND_FAILURE_WINDOW = 300  # seconds
+
+# The backend tried when the other one fails
+FALLBACK_BACKEND = {"Instaloader": "yt-dlp", "yt-dlp": "Instaloader"}
+
+
 class StreamlitDownloader:
     """Streamlit-compatible downloader class."""
     
     def __init__(self):
         self.session_manager = SessionManager()
-        self.audio_transcriber = AudioTranscriber()
+        self.audio_transcriber = None
         self.loader = None
+        self.progress_callback = None
+        # Backend name -> (recent failure count, time of the last failure)
+        self.backend_failures = {}
+    
+    def report_progress(self, url: str, progress: int, status: str):
+        """Forward agent progress updates to the status-only callback."""
+        if self.progress_callback:
+            self.progress_callback(status)
+    
+    def choose_backend(self, preferred: str) -> str:
+        """Return the preferred backend unless it has been failing recently."""
+        failures, last_failure = self.backend_failures.get(preferred, (0, 0.0))
+        if (
+            failures >= BACKEND_FAILURE_LIMIT
+            and time.time() - last_failure < BACKEND_FAILURE_WINDOW
+        ):
+            return FALLBACK_BACKEND[preferred]
+        return preferred
+    
+    def record_failure(self, backend: str):
+        """Count a failed download for the given backend."""
+        failures, _ = self.backend_failures.get(backend, (0, 0.0))
+        self.backend_failures[backend] = (failures + 1, time.time())
         
     def setup_instaloader(self):
         """Initialize Instaloader instance."""
@@ -55,72 +109,66 @@ class StreamlitDownloader:
                 save_metadata=False,
                 compress_json=False,
                 dirname_pattern=str(self.session_manager.get_session_folder()),
+                # Fail fast when Instagram throttles instead of hanging for minutes
+                request_timeout=10.0,
             )
     
+    def run_backend(self, backend: str, reel_item: ReelItem, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Download a reel with the named backend ("Instaloader" or "yt-dlp")."""
+        if backend == "Instaloader":
+            self.setup_instaloader()
+            return instaloader_agent.download_reel(
+                reel_item, 1, self.session_manager.get_session_folder(),
+                self.loader, options, self.report_progress
+            )
+        return yt_dlp_agent.download_reel(
+            reel_item, 1, self.session_manager.get_session_folder(),
+            options, self.report_progress
+        )
+    
     def download_single_reel(self, url: str, options: Dict[str, Any], progress_callback=None) -> Dict[str, Any]:
         """Download a single reel with the given options."""
+        self.progress_callback = progress_callback
         self.session_manager.setup_session_folder()
         
-        if options.get("downloader", "Instaloader") == "Instaloader":
-            self.setup_instaloader()
+        # Go straight to the other backend if the preferred one keeps failing
+        primary = self.choose_backend(options.get("downloader", "Instaloader"))
+        fallback = FALLBACK_BACKEND[primary]
         
         reel_item = ReelItem(url=url)
         
-        # Attempt download with primary downloader
+        # Attempt download with primary downloader, then the fallback
         try:
-            if options.get("downloader", "Instaloader") == "Instaloader":
-                if progress_callback:
-                    progress_callback("Starting download with Instaloader...")
-                result = instaloader_agent.download_reel(
-                    reel_item, 1, self.session_manager.get_session_folder(),
-                    self.loader, options, lambda url, progress, status: progress_callback(status)
-                )
-            else:
-                if progress_callback:
-                    progress_callback("Starting download with yt-dlp...")
-                result = yt_dlp_agent.download_reel(
-                    reel_item, 1, self.session_manager.get_session_folder(),
-                    options, lambda url, progress, status: progress_callback(status)
-                )
-            
-            # Handle transcription if enabled
-            if options.get("transcribe", False):
-                if progress_callback:
-                    progress_callback("Transcribing audio...")
-                try:
-                    self.audio_transcriber.load_whisper_model()
-                    reel_folder = Path(result["folder_path"])
-                    self.audio_transcriber.transcribe_audio_from_reel(
-                        reel_folder, 1, result, lambda url, progress, status: progress_callback(status)
-                    )
-                except Exception as e:
-                    result["transcript_error"] = str(e)
-            
-            return result
-            
+            if progress_callback:
+                progress_callback(f"Starting download with {primary}...")
+            result = self.run_backend(primary, reel_item, options)
+            self.backend_failures.pop(primary, None)
         except Exception as e:
-            # Try fallback downloader
+            self.record_failure(primary)
             try:
-                if options.get("downloader", "Instaloader") == "Instaloader":
-                    if progress_callback:
-                        progress_callback("Instaloader failed, trying yt-dlp...")
-                    result = yt_dlp_agent.download_reel(
-                        reel_item, 1, self.session_manager.get_session_folder(),
-                        options, lambda url, progress, status: progress_callback(status)
-                    )
-                else:
-                    if progress_callback:
-                        progress_callback("yt-dlp failed, trying Instaloader...")
-                    self.setup_instaloader()
-                    result = instaloader_agent.download_reel(
-                        reel_item, 1, self.session_manager.get_session_folder(),
-                        self.loader, options, lambda url, progress, status: progress_callback(status)
-                    )
-                
-                return result
-                
+                if progress_callback:
+                    progress_callback(f"{primary} failed, trying {fallback}...")
+                result = self.run_backend(fallback, reel_item, options)
             except Exception as e2:
                 raise Exception(f"Both downloaders failed: {str(e)} | {str(e2)}")
+        
+        # Handle transcription if enabled
+        if options.get("transcribe", False):
+            if progress_callback:
+                progress_callback("Transcribing audio...")
+            try:
+                self.audio_transcriber = get_audio_transcriber()
+                reel_folder = Path(result["folder_path"])
+                # Whisper installs decoding hooks on the model, and the model is
+                # shared with other sessions' downloads
+                with get_transcription_lock():
+                    self.audio_transcriber.transcribe_audio_from_reel(
+                        reel_folder, 1, result, self.report_progress
+                    )
+            except Exception as e:
+                result["transcript_error"] = str(e)
+        
+        return result
 
 
 def init_streamlit_config():
@@ -182,19 +230,27 @@ def render_sidebar():
 
 def create_download_package(result: Dict[str, Any]) -> bytes:
     """Create a zip file containing all downloaded files."""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        folder_path = Path(result.get("folder_path", ""))
-        
-        if folder_path.exists():
-            for file_path in folder_path.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(folder_path.parent)
-                    zip_file.write(file_path, arcname)
+    folder_path = result.get("folder_path")
+    if not folder_path or not os.path.isdir(folder_path):
+        return build_zip(())
     
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    parent = os.path.dirname(os.path.abspath(folder_path))
+    return build_zip(
+        (file_path, os.path.relpath(file_path, parent))
+        for file_path in iter_files(folder_path)
+    )
+
+
+# Caption and transcript previews are capped so long texts are not sent to
+# the browser again on every rerun
+PREVIEW_CHARS = 4096
+
+
+def preview_text(text: str) -> str:
+    """Return text cut to PREVIEW_CHARS, with a note when it was truncated."""
+    if len(text) <= PREVIEW_CHARS:
+        return text
+    return text[:PREVIEW_CHARS] + "\n… (truncated — download the full file)"
 
 
 def display_download_results(result: Dict[str, Any]):
@@ -246,7 +302,7 @@ def display_download_results(result: Dict[str, Any]):
         st.subheader("📝 Caption")
         st.text_area(
             label="Caption Content", 
-            value=result['caption'], 
+            value=preview_text(result['caption']), 
             height=100, 
             disabled=True,
             label_visibility="collapsed"
@@ -256,27 +312,39 @@ def display_download_results(result: Dict[str, Any]):
         st.subheader("🎤 Transcript")
         st.text_area(
             label="Transcript Content", 
-            value=result['transcript'], 
+            value=preview_text(result['transcript']), 
             height=150, 
             disabled=True,
             label_visibility="collapsed"
         )
-    
-    # Download package button
-    try:
-        zip_data = create_download_package(result)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"instagram_download_{timestamp}.zip"
         
-        st.download_button(
-            label="📦 Download All Files (ZIP)",
-            data=zip_data,
-            file_name=filename,
-            mime="application/zip",
-            use_container_width=True
-        )
-    except Exception as e:
-        st.error(f"Error creating download package: {str(e)}")
+        # Long transcripts are only previewed; offer the full file from disk
+        transcript_path = result.get('transcript_path')
+        if len(result['transcript']) > PREVIEW_CHARS and transcript_path and os.path.exists(transcript_path):
+            st.download_button(
+                label="🎤 Download Full Transcript",
+                data=Path(transcript_path).read_bytes(),
+                file_name=os.path.basename(transcript_path),
+                mime="text/plain"
+            )
+    
+    # Download package button; the archive is only built on request so a
+    # finished download does not pay for zipping files nobody asked for
+    if st.button("📦 Prepare ZIP of All Files", use_container_width=True):
+        try:
+            zip_data = create_download_package(result)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"instagram_download_{timestamp}.zip"
+            
+            st.download_button(
+                label="📦 Download All Files (ZIP)",
+                data=zip_data,
+                file_name=filename,
+                mime="application/zip",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"Error creating download package: {str(e)}")
 
 
 def main():
@@ -312,37 +380,62 @@ def main():
             st.error("❌ Please enter a valid Instagram URL")
             return
         
-        # Initialize progress
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        try:
-            # Initialize downloader
-            downloader = StreamlitDownloader()
+        if "download_job" not in st.session_state:
+            st.session_state.pop("last_result", None)
             
-            # Progress callback
-            def update_progress(message):
-                status_text.text(f"⏳ {message}")
+            # Reuse the downloader across reruns so the transcriber and
+            # Instaloader instance are only set up once per browser session
+            if "downloader" not in st.session_state:
+                st.session_state.downloader = StreamlitDownloader()
+            downloader = st.session_state.downloader
             
-            # Start download
-            with st.spinner("Initializing download..."):
-                result = downloader.download_single_reel(
-                    url_input.strip(), 
-                    options, 
-                    progress_callback=update_progress
-                )
+            # The worker thread cannot touch Streamlit elements, so it only
+            # records the latest message for the script thread to render
+            progress = {"message": "Initializing download..."}
             
-            # Clear progress indicators
-            progress_bar.progress(100)
-            status_text.text("✅ Download completed!")
+            def update_progress(message):
+                progress["message"] = message
             
-            # Display results
-            display_download_results(result)
+            future = get_download_executor().submit(
+                downloader.download_single_reel,
+                url_input.strip(),
+                options,
+                progress_callback=update_progress
+            )
+            st.session_state.download_job = (future, progress)
+    
+    # Track the running download; it keeps going in the background if a
+    # widget interaction reruns the script, and is picked up again here
+    if "download_job" in st.session_state:
+        future, progress = st.session_state.download_job
+        
+        # A status container only sends label changes to the browser
+        with st.status("⏳ Starting download...", expanded=False) as status:
+            last_message = None
+            while not future.done():
+                if progress["message"] != last_message:
+                    last_message = progress["message"]
+                    status.update(label=f"⏳ {last_message}")
+                time.sleep(0.5)
             
-        except Exception as e:
-            st.error(f"❌ Download failed: {str(e)}")
+            del st.session_state.download_job
+            
+            error = future.exception()
+            if error is None:
+                st.session_state.last_result = future.result()
+                status.update(label="✅ Download completed!", state="complete")
+            else:
+                status.update(label="❌ Download failed", state="error")
+        
+        if error is not None:
+            st.error(f"❌ Download failed: {str(error)}")
             st.info("💡 Try switching to a different downloader in the sidebar options.")
     
+    # Display results; they are kept across reruns so the ZIP can be
+    # prepared with a second click
+    if "last_result" in st.session_state:
+        display_download_results(st.session_state.last_result)
+    
     # Footer
     st.markdown("---")
     st.markdown("""
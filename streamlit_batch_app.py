@@ -6,16 +6,16 @@ Enhanced version that supports batch downloading multiple URLs.
 
 import streamlit as st
 import os
-import tempfile
-import zipfile
-import io
+import hashlib
 from pathlib import Path
 from typing import List, Dict, Any
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from collections import deque
 import queue
 import uuid
+import time
 import warnings
 
 # Suppress warnings
@@ -26,113 +26,244 @@ warnings.filterwarnings("ignore", category=UserWarning)
 from src.core.data_models import ReelItem
 from src.core.session_manager import SessionManager
 from src.utils.url_validator import is_valid_instagram_url
-from src.agents import instaloader as instaloader_agent
-from src.agents import yt_dlp as yt_dlp_agent
-from src.core.transcriber import AudioTranscriber
+from src.utils.zip_utils import build_zip, iter_files
 from src.utils.lazy_imports import lazy_import_instaloader
 
 
+@st.cache_resource
+def get_audio_transcriber():
+    """Load the Whisper model once per server process and share it across batches."""
+    from src.core.transcriber import AudioTranscriber
+    
+    transcriber = AudioTranscriber()
+    transcriber.load_whisper_model()
+    if transcriber.whisper_model is None:
+        # Raising keeps the failed load out of the cache so it is retried
+        raise RuntimeError("Whisper model could not be loaded")
+    return transcriber
+
+
+@st.cache_resource
+def get_transcription_lock() -> threading.Lock:
+    """Lock serialising use of the shared Whisper model across concurrent batches."""
+    return threading.Lock()
+
+
+@st.cache_resource
+def get_instaloader_pool() -> queue.SimpleQueue:
+    """Idle Instaloader instances, reused across batches so their HTTP sessions stay open."""
+    return queue.SimpleQueue()
+
+
+# Minimum seconds between repeated progress updates for the same URL
+PROGRESS_INTERVAL = 0.1
+
+# Queued by download_batch once it has finished, successfully or not
+BATCH_DONE = (None, None, "__DONE__")
+
+
 class BatchDownloader:
     """Streamlit-compatible batch downloader class."""
     
     def __init__(self):
         self.session_manager = SessionManager()
-        self.audio_transcriber = AudioTranscriber()
-        self.loader = None
-        self.progress_queue = queue.Queue()
+        # Set by download_batch only when transcription is requested
+        self.audio_transcriber = None
+        # deque.append/popleft are atomic, so producers need no lock; the
+        # event wakes the script thread when there is something to show
+        self.progress_queue = deque()
+        self._progress_event = threading.Event()
+        # url -> (monotonic time, progress) of the last update report_progress queued
+        self._last_report = {}
         self.results = []
+        # Instaloader instances are not thread-safe, so each worker checks one
+        # out of the shared pool for the duration of a URL
+        self._local = threading.local()
+        self._results_lock = threading.Lock()
+        # Downloaded reels waiting for the transcription thread
+        self._transcribe_queue = queue.Queue()
         
     def setup_instaloader(self):
-        """Initialize Instaloader instance."""
-        if self.loader is None:
-            instaloader_module = lazy_import_instaloader()
-            self.loader = instaloader_module.Instaloader(
-                download_video_thumbnails=True,
-                download_comments=False,
-                save_metadata=False,
-                compress_json=False,
-                dirname_pattern=str(self.session_manager.get_session_folder()),
-            )
+        """Return the Instaloader this worker thread has checked out, taking one if needed."""
+        loader = getattr(self._local, "loader", None)
+        if loader is None:
+            try:
+                loader = get_instaloader_pool().get_nowait()
+            except queue.Empty:
+                instaloader_module = lazy_import_instaloader()
+                loader = instaloader_module.Instaloader(
+                    download_video_thumbnails=True,
+                    download_comments=False,
+                    save_metadata=False,
+                    compress_json=False,
+                )
+            self._local.loader = loader
+        return loader
     
-    def download_batch(self, urls: List[str], options: Dict[str, Any]):
-        """Download multiple URLs in batch."""
-        self.session_manager.setup_session_folder()
-        
-        if options.get("downloader", "Instaloader") == "Instaloader":
-            self.setup_instaloader()
-        
-        # Load transcription model if needed
-        if options.get("transcribe", False):
-            self.progress_queue.put(("", 0, "Loading transcription model..."))
-            self.audio_transcriber.load_whisper_model()
-        
-        total_urls = len(urls)
+    def release_instaloader(self):
+        """Hand this worker thread's Instaloader, if any, back to the shared pool."""
+        loader = getattr(self._local, "loader", None)
+        if loader is not None:
+            self._local.loader = None
+            get_instaloader_pool().put(loader)
+    
+    def report_progress(self, url: str, progress: int, status: str):
+        """Queue a progress update for the Streamlit script thread.
         
-        for i, url in enumerate(urls, 1):
-            try:
-                self.progress_queue.put((url, 0, f"Processing {i}/{total_urls}: Starting download..."))
-                
-                reel_item = ReelItem(url=url)
-                
-                # Try primary downloader
+        Callbacks can fire many times a second (the transcriber reports every
+        decoded segment), so updates that only change the status text are
+        queued at most every PROGRESS_INTERVAL seconds. A new progress value,
+        including 100%, is always queued.
+        """
+        now = time.monotonic()
+        last_time, last_progress = self._last_report.get(url, (0.0, None))
+        if progress != last_progress or now - last_time >= PROGRESS_INTERVAL:
+            self._last_report[url] = (now, progress)
+            self._push_progress((url, progress, status))
+    
+    def _push_progress(self, update):
+        """Append an update to the progress queue and wake the reader."""
+        self.progress_queue.append(update)
+        self._progress_event.set()
+    
+    def wait_for_progress(self, timeout: float) -> List[tuple]:
+        """Wait up to timeout seconds for updates, then return all pending ones in order."""
+        self._progress_event.wait(timeout)
+        self._progress_event.clear()
+        updates = []
+        while self.progress_queue:
+            updates.append(self.progress_queue.popleft())
+        return updates
+    
+    def download_batch(self, urls: List[str], options: Dict[str, Any]):
+        """Download multiple URLs in batch, up to max_concurrent at a time.
+
+        BATCH_DONE is always queued last, even if the batch fails early.
+        """
+        try:
+            self.session_manager.setup_session_folder()
+            
+            # Load transcription model if needed, and transcribe on a dedicated
+            # thread so downloads carry on while the model is busy
+            transcribe_thread = None
+            if options.get("transcribe", False):
+                self._push_progress(("", 0, "Loading transcription model..."))
                 try:
-                    if options.get("downloader", "Instaloader") == "Instaloader":
-                        result = instaloader_agent.download_reel(
-                            reel_item, i, self.session_manager.get_session_folder(),
-                            self.loader, options, 
-                            lambda url, progress, status: self.progress_queue.put((url, progress, status))
-                        )
-                    else:
-                        result = yt_dlp_agent.download_reel(
-                            reel_item, i, self.session_manager.get_session_folder(),
-                            options, 
-                            lambda url, progress, status: self.progress_queue.put((url, progress, status))
-                        )
-                except Exception as e:
-                    # Try fallback downloader
-                    self.progress_queue.put((url, 0, f"Primary downloader failed, trying fallback..."))
-                    
-                    if options.get("downloader", "Instaloader") == "Instaloader":
-                        result = yt_dlp_agent.download_reel(
-                            reel_item, i, self.session_manager.get_session_folder(),
-                            options, 
-                            lambda url, progress, status: self.progress_queue.put((url, progress, status))
-                        )
-                    else:
-                        self.setup_instaloader()
-                        result = instaloader_agent.download_reel(
-                            reel_item, i, self.session_manager.get_session_folder(),
-                            self.loader, options, 
-                            lambda url, progress, status: self.progress_queue.put((url, progress, status))
-                        )
-                
-                # Handle transcription
-                if options.get("transcribe", False):
-                    self.progress_queue.put((url, 90, "Transcribing audio..."))
-                    try:
-                        reel_folder = Path(result["folder_path"])
-                        self.audio_transcriber.transcribe_audio_from_reel(
-                            reel_folder, i, result, 
-                            lambda url, progress, status: self.progress_queue.put((url, progress, status))
-                        )
-                    except Exception as e:
-                        result["transcript_error"] = str(e)
-                
-                result["url"] = url
-                result["status"] = "completed"
-                self.results.append(result)
-                self.progress_queue.put((url, 100, "Completed"))
-                
+                    self.audio_transcriber = get_audio_transcriber()
+                except RuntimeError as e:
+                    # Download the batch anyway, just without transcripts
+                    self._push_progress(("", 0, f"Transcription unavailable: {e}"))
+                    options = {**options, "transcribe": False}
+                else:
+                    transcribe_thread = threading.Thread(target=self._transcribe_worker, daemon=True)
+                    transcribe_thread.start()
+            
+            total_urls = len(urls)
+            max_workers = max(1, int(options.get("max_concurrent", 1)))
+            
+            # Each URL is dominated by network I/O, so downloads overlap well
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(self._download_one, i, url, total_urls, options)
+                        for i, url in enumerate(urls, 1)
+                    ]
+                    for future in as_completed(futures):
+                        with self._results_lock:
+                            self.results.append(future.result())
+            finally:
+                # Let the transcription thread finish the reels already queued
+                if transcribe_thread:
+                    self._transcribe_queue.put(None)
+                    transcribe_thread.join()
+            
+            self._push_progress(("", 100, "Batch download completed!"))
+        finally:
+            self._push_progress(BATCH_DONE)
+    
+    def _transcribe_worker(self):
+        """Transcribe queued reels one at a time until a None sentinel arrives."""
+        while True:
+            item = self._transcribe_queue.get()
+            if item is None:
+                return
+            
+            i, result = item
+            url = result["url"]
+            self._push_progress((url, 90, "Transcribing audio..."))
+            try:
+                reel_folder = Path(result["folder_path"])
+                # Whisper installs decoding hooks on the model, and the model is
+                # shared with other sessions' batches
+                with get_transcription_lock():
+                    self.audio_transcriber.transcribe_audio_from_reel(
+                        reel_folder, i, result, self.report_progress
+                    )
             except Exception as e:
-                error_result = {
-                    "url": url,
-                    "status": "error",
-                    "error": str(e)
-                }
-                self.results.append(error_result)
-                self.progress_queue.put((url, 0, f"Error: {str(e)}"))
+                result["transcript_error"] = str(e)
+            self._push_progress((url, 100, "Completed"))
+    
+    def _download_one(self, i: int, url: str, total_urls: int, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Download the i-th URL of the batch, queueing it for transcription if requested."""
+        # Imported here so the page renders without loading the download backends
+        from src.agents import instaloader as instaloader_agent
+        from src.agents import yt_dlp as yt_dlp_agent
         
-        self.progress_queue.put(("", 100, "Batch download completed!"))
+        try:
+            self._push_progress((url, 0, f"Processing {i}/{total_urls}: Starting download..."))
+            
+            reel_item = ReelItem(url=url)
+            
+            # Try primary downloader
+            try:
+                if options.get("downloader", "Instaloader") == "Instaloader":
+                    result = instaloader_agent.download_reel(
+                        reel_item, i, self.session_manager.get_session_folder(),
+                        self.setup_instaloader(), options, self.report_progress
+                    )
+                else:
+                    result = yt_dlp_agent.download_reel(
+                        reel_item, i, self.session_manager.get_session_folder(),
+                        options, self.report_progress
+                    )
+            except Exception as e:
+                # Try fallback downloader
+                self._push_progress((url, 0, f"Primary downloader failed, trying fallback..."))
+                
+                if options.get("downloader", "Instaloader") == "Instaloader":
+                    result = yt_dlp_agent.download_reel(
+                        reel_item, i, self.session_manager.get_session_folder(),
+                        options, self.report_progress
+                    )
+                else:
+                    result = instaloader_agent.download_reel(
+                        reel_item, i, self.session_manager.get_session_folder(),
+                        self.setup_instaloader(), options, self.report_progress
+                    )
+            
+            result["url"] = url
+            result["url_key"] = url_key(url)
+            result["status"] = "completed"
+            
+            # Hand transcription off so this worker can start the next download;
+            # the transcription thread reports completion for this URL
+            if options.get("transcribe", False):
+                self._push_progress((url, 90, "Waiting for transcription..."))
+                self._transcribe_queue.put((i, result))
+            else:
+                self._push_progress((url, 100, "Completed"))
+            return result
+            
+        except Exception as e:
+            self._push_progress((url, 0, f"Error: {str(e)}"))
+            return {
+                "url": url,
+                "url_key": url_key(url),
+                "status": "error",
+                "error": str(e)
+            }
+        finally:
+            self.release_instaloader()
 
 
 def init_streamlit_config():
@@ -145,17 +276,20 @@ def init_streamlit_config():
     )
 
 
-def render_header():
-    """Render the application header."""
-    st.title("📱 Instagram Batch Media Downloader")
-    st.markdown("""
+HEADER_HTML = """
     <div style="background: linear-gradient(90deg, #833ab4, #fd1d1d, #fcb045); 
                 padding: 1rem; border-radius: 10px; margin-bottom: 2rem;">
         <h3 style="color: white; text-align: center; margin: 0;">
             Download Multiple Instagram Reels and Posts at Once!
         </h3>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+def render_header():
+    """Render the application header."""
+    st.title("📱 Instagram Batch Media Downloader")
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 
 def render_sidebar():
@@ -197,97 +331,106 @@ def render_sidebar():
     }
 
 
+@st.cache_data(max_entries=32)
 def parse_urls(text: str) -> List[str]:
-    """Parse URLs from text input."""
-    lines = text.strip().split('\n')
+    """Parse unique URLs from text input, reusing the result across reruns."""
+    seen = set()
     urls = []
     
-    for line in lines:
+    for line in text.splitlines():
         line = line.strip()
-        if line and is_valid_instagram_url(line):
+        # A URL pasted twice would otherwise be downloaded twice
+        if line and line not in seen and is_valid_instagram_url(line):
+            seen.add(line)
             urls.append(line)
     
     return urls
 
 
-def create_batch_download_package(results: List[Dict[str, Any]]) -> bytes:
-    """Create a zip file containing all downloaded files from batch."""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for result in results:
-            if result.get("status") == "completed":
-                folder_path = Path(result.get("folder_path", ""))
-                
-                if folder_path.exists():
-                    for file_path in folder_path.rglob("*"):
-                        if file_path.is_file():
-                            # Create a unique path within the zip
-                            url_hash = str(hash(result["url"]))[-8:]
-                            arcname = f"{url_hash}_{folder_path.name}/{file_path.relative_to(folder_path)}"
-                            zip_file.write(file_path, arcname)
-    
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+def url_key(url: str) -> str:
+    """Short, stable identifier for a URL (unlike hash(), which changes per process)."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=4).hexdigest()
+
+
+def iter_batch_files(completed: List[Dict[str, Any]]):
+    """Yield (file_path, arcname) pairs for every file in the batch's completed results."""
+    for result in completed:
+        folder_path = Path(result.get("folder_path", ""))
+        
+        if folder_path.exists():
+            # Create a unique path within the zip
+            prefix = f"{result['url_key']}_{folder_path.name}"
+            for file_path in iter_files(str(folder_path)):
+                yield file_path, f"{prefix}/{os.path.relpath(file_path, folder_path)}"
+
+
+def create_batch_download_package(completed: List[Dict[str, Any]]) -> bytes:
+    """Create a zip file containing all files from the batch's completed results."""
+    return build_zip(iter_batch_files(completed))
 
 
 def display_batch_results(results: List[Dict[str, Any]]):
     """Display batch download results."""
-    completed = sum(1 for r in results if r.get("status") == "completed")
+    # Split the results once; the sections below iterate these lists
+    completed = []
+    errors = []
+    for result in results:
+        status = result.get("status")
+        if status == "completed":
+            completed.append(result)
+        elif status == "error":
+            errors.append(result)
     total = len(results)
-    errors = sum(1 for r in results if r.get("status") == "error")
     
     # Summary
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("✅ Completed", completed)
+        st.metric("✅ Completed", len(completed))
     with col2:
-        st.metric("❌ Errors", errors)
+        st.metric("❌ Errors", len(errors))
     with col3:
         st.metric("📊 Total", total)
     
     # Detailed results
-    if completed > 0:
+    if completed:
         st.subheader("✅ Completed Downloads")
-        for result in results:
-            if result.get("status") == "completed":
-                with st.expander(f"📹 {result.get('title', 'Unknown Title')} - {result['url'][:50]}..."):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write("**Files:**")
-                        if result.get('video_path'):
-                            st.write("📹 Video")
-                        if result.get('thumbnail_path'):
-                            st.write("🖼️ Thumbnail")
-                        if result.get('audio_path'):
-                            st.write("🎵 Audio")
-                        if result.get('caption_path'):
-                            st.write("📝 Caption")
-                        if result.get('transcript_path'):
-                            st.write("🎤 Transcript")
-                    
-                    with col2:
-                        st.write("**Details:**")
-                        st.write(f"Folder: {result.get('folder_path', 'N/A')}")
-                        if result.get('caption'):
-                            st.text_area("Caption:", value=result['caption'][:200] + "...", height=100, key=f"caption_{hash(result['url'])}")
+        for result in completed:
+            with st.expander(f"📹 {result.get('title', 'Unknown Title')} - {result['url'][:50]}..."):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.write("**Files:**")
+                    if result.get('video_path'):
+                        st.write("📹 Video")
+                    if result.get('thumbnail_path'):
+                        st.write("🖼️ Thumbnail")
+                    if result.get('audio_path'):
+                        st.write("🎵 Audio")
+                    if result.get('caption_path'):
+                        st.write("📝 Caption")
+                    if result.get('transcript_path'):
+                        st.write("🎤 Transcript")
+                
+                with col2:
+                    st.write("**Details:**")
+                    st.write(f"Folder: {result.get('folder_path', 'N/A')}")
+                    if result.get('caption'):
+                        st.text_area("Caption:", value=result['caption'][:200] + "...", height=100, key=f"caption_{result['url_key']}")
     
-    if errors > 0:
+    if errors:
         st.subheader("❌ Failed Downloads")
-        for result in results:
-            if result.get("status") == "error":
-                st.error(f"**{result['url'][:50]}...** - {result.get('error', 'Unknown error')}")
+        for result in errors:
+            st.error(f"**{result['url'][:50]}...** - {result.get('error', 'Unknown error')}")
     
     # Download all files
-    if completed > 0:
+    if completed:
         try:
-            zip_data = create_batch_download_package(results)
+            zip_data = create_batch_download_package(completed)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"instagram_batch_download_{timestamp}.zip"
             
             st.download_button(
-                label=f"📦 Download All Files ({completed} items)",
+                label=f"📦 Download All Files ({len(completed)} items)",
                 data=zip_data,
                 file_name=filename,
                 mime="application/zip",
@@ -396,7 +539,9 @@ def main():
         # Progress tracking
         url_progress_bars = {}
         url_status_texts = {}
-        completed_count = 0
+        # The agents report 100% when the download finishes and the batch
+        # reports it again once the URL is done, so count distinct URLs
+        completed_urls = set()
         
         # Create progress bars for each URL
         with url_progress_container:
@@ -408,33 +553,36 @@ def main():
                 with col2:
                     url_progress_bars[url] = st.progress(0)
         
-        # Monitor progress
-        while download_thread.is_alive() or not downloader.progress_queue.empty():
-            try:
-                # Get progress updates
-                while not downloader.progress_queue.empty():
-                    url, progress, status = downloader.progress_queue.get_nowait()
-                    
-                    if url:  # URL-specific progress
-                        if url in url_progress_bars:
-                            url_progress_bars[url].progress(progress)
-                            url_status_texts[url].text(f"🔗 {url[:60]}... - {status}")
-                            
-                            if progress == 100:
-                                completed_count += 1
-                    else:  # Overall status
-                        overall_status.text(f"⏳ {status}")
-                
-                # Update overall progress
-                if urls:
-                    overall_progress_value = completed_count / len(urls)
-                    overall_progress.progress(overall_progress_value)
-                
-                time.sleep(0.1)
+        # Monitor progress; sleep until a worker signals an update, then
+        # apply all queued updates before touching the overall bar
+        done = False
+        while not done:
+            updates = downloader.wait_for_progress(0.25)
+            
+            # Only the newest update per URL is drawn
+            latest = {}
+            for update in updates:
+                if update == BATCH_DONE:
+                    done = True
+                    continue
                 
-            except queue.Empty:
-                time.sleep(0.1)
-                continue
+                url, progress, status = update
+                latest[url] = (progress, status)
+                if url and progress == 100:
+                    completed_urls.add(url)
+            
+            for url, (progress, status) in latest.items():
+                if url:  # URL-specific progress
+                    if url in url_progress_bars:
+                        url_progress_bars[url].progress(progress)
+                        url_status_texts[url].text(f"🔗 {url[:60]}... - {status}")
+                else:  # Overall status
+                    overall_status.text(f"⏳ {status}")
+            
+            # Update overall progress
+            if urls:
+                overall_progress_value = len(completed_urls) / len(urls)
+                overall_progress.progress(overall_progress_value)
         
         # Wait for thread to complete
         download_thread.join()
@@ -4,6 +4,7 @@ Configuration file for Streamlit deployment
 
 import streamlit as st
 import os
+import re
 from pathlib import Path
 
 # Streamlit configuration
@@ -37,8 +38,15 @@ def configure_streamlit():
     )
 
 # Environment configuration
+_environment_ready = False
+
 def setup_environment():
-    """Set up the environment for the application."""
+    """Set up the environment for the application, once per process."""
+    global _environment_ready
+    # Streamlit reruns the app script on every interaction, but this module
+    # is imported once, so later calls can return straight away
+    if _environment_ready:
+        return
     
     # Create necessary directories
     directories = [
@@ -53,6 +61,7 @@ def setup_environment():
     # Set environment variables for better performance
     os.environ["STREAMLIT_BROWSER_GATHER_USAGE_STATS"] = "false"
     os.environ["STREAMLIT_THEME_BASE"] = "dark"
+    _environment_ready = True
 
 # Cache configuration
 @st.cache_data
@@ -334,18 +343,12 @@ def get_file_icon(file_extension):
     }
     return icons.get(file_extension.lower(), '📄')
 
+# instagram.com post/reel, instagr.am post and ig.me short links in one pass
+_INSTAGRAM_URL_RE = re.compile(
+    r'https?://(?:(?:www\.)?instagram\.com/(?:p|reel)/|(?:www\.)?instagr\.am/p/|ig\.me/)'
+    r'([A-Za-z0-9_-]+)/?'
+)
+
 def validate_instagram_url(url):
     """Enhanced Instagram URL validation."""
-    import re
-    
-    patterns = [
-        r'https?://(?:www\.)?instagram\.com/(?:p|reel)/([A-Za-z0-9_-]+)/?',
-        r'https?://(?:www\.)?instagr\.am/p/([A-Za-z0-9_-]+)/?',
-        r'https?://ig\.me/([A-Za-z0-9_-]+)/?'
-    ]
-    
-    for pattern in patterns:
-        if re.match(pattern, url):
-            return True
-    
-    return False
+    return _INSTAGRAM_URL_RE.match(url) is not None
@@ -1,21 +1,23 @@
 """
 Instagram Media Downloader - Preview Mode Streamlit Application
 
-This version focuses on previewing content without saving to local storage.
+This version focuses on previewing content before anything is saved locally;
+media is only kept in temporary files on the server.
 Users can preview media and download individual files as needed.
 """
 
 import streamlit as st
 import os
+import re
 import sys
 import io
-import base64
 import tempfile
-import zipfile
 from pathlib import Path
 from typing import List, Dict, Any
 import threading
 import time
+import copy
+from collections import OrderedDict
 from datetime import datetime
 import warnings
 
@@ -28,27 +30,27 @@ if str(project_root) not in sys.path:
 warnings.filterwarnings("ignore", category=SyntaxWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 
+# KEY=value lines of a .env file, skipping comments; split at the first "="
+_ENV_LINE_RE = re.compile(r"^[ \t]*([^#=\s][^=\n]*)=(.*)$", re.MULTILINE)
+
 # Load environment variables from .env file
 def load_env_file():
     """Load environment variables from .env file."""
     env_file = Path(__file__).parent / ".env"
     if env_file.exists():
         with open(env_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and value and not value.startswith("gsk_your"):
-                        os.environ[key] = value
+            text = f.read()
+        for key, value in _ENV_LINE_RE.findall(text):
+            key = key.strip()
+            value = value.strip().strip('"').strip("'")
+            if key and value and not value.startswith("gsk_your"):
+                os.environ[key] = value
 
 # Load .env on startup
 load_env_file()
 
 # Import your existing core functionality
 from src.core.data_models import ReelItem
-from src.core.session_manager import SessionManager
 from src.utils.url_validator import is_valid_instagram_url
 from src.agents import instaloader as instaloader_agent
 
@@ -62,6 +64,7 @@ except ImportError:
 
 from src.core.transcriber import AudioTranscriber
 from src.utils.lazy_imports import lazy_import_instaloader
+from src.utils.zip_utils import build_zip
 import json
 
 # Lazy import for Groq-related modules (only imported when needed)
@@ -77,11 +80,19 @@ def lazy_import_groq():
         return None, None
 
 
+# Media files kept on disk for preview:
+# (file_contents key, result path key, name inside the ZIP)
+PREVIEW_MEDIA = (
+    ("video", "video_path", "video.mp4"),
+    ("thumbnail", "thumbnail_path", "thumbnail.jpg"),
+    ("audio", "audio_path", "audio.mp3"),
+)
+
+
 class PreviewDownloader:
     """Streamlit-compatible downloader with preview functionality."""
     
     def __init__(self, groq_api_key: str = None, use_groq: bool = True):
-        self.session_manager = SessionManager()
         self.use_groq = use_groq
         
         # Initialize appropriate transcriber
@@ -102,6 +113,10 @@ class PreviewDownloader:
             self.transcriber_type = "whisper"
         
         self.loader = None
+        # One instance serves every session (see get_downloader), so the
+        # non-thread-safe Instaloader and transcription model are used under locks
+        self._instaloader_lock = threading.Lock()
+        self._transcribe_lock = threading.Lock()
         
     def setup_instaloader(self):
         """Initialize Instaloader instance with better error handling."""
@@ -130,8 +145,7 @@ class PreviewDownloader:
         """Download content and return file data for preview."""
         
         # Create temporary session for this download
-        temp_session = tempfile.mkdtemp()
-        self.session_manager.session_folder = Path(temp_session)
+        session_folder = Path(tempfile.mkdtemp())
         
         if progress_callback:
             progress_callback("Initializing download...")
@@ -149,17 +163,18 @@ class PreviewDownloader:
                 if progress_callback:
                     progress_callback("Downloading with yt-dlp...")
                 result = yt_dlp_agent.download_reel(
-                    reel_item, 1, self.session_manager.session_folder,
+                    reel_item, 1, session_folder,
                     options, lambda url, progress, status: progress_callback(status) if progress_callback else None
                 )
             else:
                 if progress_callback:
                     progress_callback("Downloading with Instaloader...")
-                result = instaloader_agent.download_reel(
-                    reel_item, 1, self.session_manager.session_folder,
-                    self.loader, options, 
-                    lambda url, progress, status: progress_callback(status) if progress_callback else None
-                )
+                with self._instaloader_lock:
+                    result = instaloader_agent.download_reel(
+                        reel_item, 1, session_folder,
+                        self.loader, options, 
+                        lambda url, progress, status: progress_callback(status) if progress_callback else None
+                    )
         except Exception as e:
             # Try fallback downloader
             try:
@@ -169,14 +184,15 @@ class PreviewDownloader:
                 if options.get("downloader", "yt-dlp") == "yt-dlp":
                     if not self.setup_instaloader():
                         raise Exception("Both downloaders failed")
-                    result = instaloader_agent.download_reel(
-                        reel_item, 1, self.session_manager.session_folder,
-                        self.loader, options, 
-                        lambda url, progress, status: progress_callback(status) if progress_callback else None
-                    )
+                    with self._instaloader_lock:
+                        result = instaloader_agent.download_reel(
+                            reel_item, 1, session_folder,
+                            self.loader, options, 
+                            lambda url, progress, status: progress_callback(status) if progress_callback else None
+                        )
                 else:
                     result = yt_dlp_agent.download_reel(
-                        reel_item, 1, self.session_manager.session_folder,
+                        reel_item, 1, session_folder,
                         options, lambda url, progress, status: progress_callback(status) if progress_callback else None
                     )
             except Exception as e2:
@@ -190,22 +206,23 @@ class PreviewDownloader:
                 reel_folder = Path(result["folder_path"])
                 
                 # Use Groq transcriber if available, otherwise fallback to Whisper
-                if self.transcriber_type == "groq":
-                    if progress_callback:
-                        progress_callback("Using Groq for Hinglish transcription...")
-                    self.audio_transcriber.transcribe_audio_from_reel(
-                        reel_folder, 1, result, 
-                        lambda url, progress, status: progress_callback(status) if progress_callback else None,
-                        enable_post_processing=options.get("enable_hinglish_processing", True)
-                    )
-                else:
-                    if progress_callback:
-                        progress_callback("Using local Whisper model...")
-                    self.audio_transcriber.load_whisper_model()
-                    self.audio_transcriber.transcribe_audio_from_reel(
-                        reel_folder, 1, result, 
-                        lambda url, progress, status: progress_callback(status) if progress_callback else None
-                    )
+                with self._transcribe_lock:
+                    if self.transcriber_type == "groq":
+                        if progress_callback:
+                            progress_callback("Using Groq for Hinglish transcription...")
+                        self.audio_transcriber.transcribe_audio_from_reel(
+                            reel_folder, 1, result, 
+                            lambda url, progress, status: progress_callback(status) if progress_callback else None,
+                            enable_post_processing=options.get("enable_hinglish_processing", True)
+                        )
+                    else:
+                        if progress_callback:
+                            progress_callback("Using local Whisper model...")
+                        self.audio_transcriber.load_whisper_model()
+                        self.audio_transcriber.transcribe_audio_from_reel(
+                            reel_folder, 1, result, 
+                            lambda url, progress, status: progress_callback(status) if progress_callback else None
+                        )
             except Exception as e:
                 result["transcript_error"] = str(e)
         
@@ -217,37 +234,81 @@ class PreviewDownloader:
         return result
     
     def _load_file_contents(self, result: Dict[str, Any]) -> Dict[str, Any]:
-        """Load file contents into memory for preview."""
+        """Collect preview content: media as file paths, text loaded into memory."""
         contents = {}
         
-        # Load video
-        if result.get('video_path') and Path(result['video_path']).exists():
-            with open(result['video_path'], 'rb') as f:
-                contents['video'] = f.read()
-        
-        # Load thumbnail
-        if result.get('thumbnail_path') and Path(result['thumbnail_path']).exists():
-            with open(result['thumbnail_path'], 'rb') as f:
-                contents['thumbnail'] = f.read()
-        
-        # Load audio
-        if result.get('audio_path') and Path(result['audio_path']).exists():
-            with open(result['audio_path'], 'rb') as f:
-                contents['audio'] = f.read()
-        
-        # Load caption (text)
-        if result.get('caption_path') and Path(result['caption_path']).exists():
-            with open(result['caption_path'], 'r', encoding='utf-8') as f:
-                contents['caption_text'] = f.read()
-        
-        # Load transcript (text)
-        if result.get('transcript_path') and Path(result['transcript_path']).exists():
-            with open(result['transcript_path'], 'r', encoding='utf-8') as f:
-                contents['transcript_text'] = f.read()
+        # Media stays on disk; Streamlit reads it from the path when rendering,
+        # so the session state doesn't hold a second copy of every file
+        for key, path_key, _ in PREVIEW_MEDIA:
+            path = result.get(path_key)
+            if not path:
+                continue
+            # One stat both confirms the file exists and skips empty leftovers
+            try:
+                if os.stat(path).st_size:
+                    contents[key] = path
+            except OSError:
+                pass
+        
+        # Load caption and transcript text; opening directly avoids a separate
+        # existence check per file
+        for key, path_key in (('caption_text', 'caption_path'), ('transcript_text', 'transcript_path')):
+            path = result.get(path_key)
+            if not path:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    contents[key] = f.read()
+            except FileNotFoundError:
+                pass
         
         return contents
 
 
+@st.cache_resource(show_spinner=False)
+def get_downloader(groq_api_key: str = None, use_groq: bool = True) -> PreviewDownloader:
+    """Shared PreviewDownloader, so its transcriber and Instaloader outlive a single preview."""
+    return PreviewDownloader(groq_api_key=groq_api_key, use_groq=use_groq)
+
+
+# Previews kept per browser session, most recently used last
+PREVIEW_CACHE_SIZE = 32
+
+
+def cached_preview(downloader: PreviewDownloader, url: str, options: Dict[str, Any], progress_callback=None) -> Dict[str, Any]:
+    """Preview a URL, reusing this session's earlier result for the same URL and options."""
+    cache = st.session_state.setdefault("preview_cache", OrderedDict())
+    key = (url, json.dumps(options, sort_keys=True, default=str))
+    if key in cache:
+        cache.move_to_end(key)
+        # Callers add AI prompts to the result, so hand out a copy
+        return copy.deepcopy(cache[key])
+    
+    result = downloader.download_for_preview(url, options, progress_callback=progress_callback)
+    # Partial results (e.g. a rate-limited transcription) are not kept, so
+    # previewing the URL again retries instead of replaying the failure
+    if is_complete_preview(result, options):
+        cache[key] = copy.deepcopy(result)
+        if len(cache) > PREVIEW_CACHE_SIZE:
+            cache.popitem(last=False)
+    return result
+
+
+def is_complete_preview(result: Dict[str, Any], options: Dict[str, Any]) -> bool:
+    """Whether a preview has every media file and the transcript its options asked for."""
+    if result.get("transcript_error"):
+        return False
+    file_contents = result.get("file_contents", {})
+    for key, _, _ in PREVIEW_MEDIA:
+        if options.get(key) and key not in file_contents:
+            return False
+    # AudioTranscriber reports its own failures in result["transcript"] and
+    # writes no transcript file, so check for the text itself
+    if options.get("transcribe") and "transcript_text" not in file_contents:
+        return False
+    return True
+
+
 def init_streamlit_config():
     """Initialize Streamlit page configuration."""
     st.set_page_config(
@@ -258,17 +319,28 @@ def init_streamlit_config():
     )
 
 
-def render_header():
-    """Render the application header."""
-    st.title("📱 Instagram Media Previewer")
-    st.markdown("""
+HEADER_HTML = """
     <div style="background: linear-gradient(90deg, #833ab4, #fd1d1d, #fcb045); 
                 padding: 1rem; border-radius: 10px; margin-bottom: 2rem;">
         <h3 style="color: white; text-align: center; margin: 0;">
-            Preview Instagram Content - No Local Storage Required!
+            Preview Instagram Content - Download Only What You Need!
         </h3>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+FOOTER_HTML = """
+    <div style="text-align: center; color: gray; font-size: 0.8em;">
+        <p>Multi-Platform Media Downloader | Temporary Storage Only | Built with Streamlit</p>
+        <p>⚠️ Please respect content creators' rights and platform terms of service</p>
+        <p>🔒 Previewed media is kept in temporary files on the server, not in your downloads</p>
+    </div>
+    """
+
+
+def render_header():
+    """Render the application header."""
+    st.title("📱 Instagram Media Previewer")
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 
 def render_sidebar():
@@ -565,7 +637,7 @@ def render_sidebar():
         st.sidebar.info("""
     • **RapidAPI** bypasses Instagram restrictions
     • **Groq** for Hinglish transcription
-    • **No files saved locally** - everything in memory
+    • **Media kept in temporary files** - nothing saved to your device
     • **Download individual files** from preview
     • **Works with public content**
     """)
@@ -573,7 +645,7 @@ def render_sidebar():
         st.sidebar.info("""
     • **yt-dlp** is recommended for Instagram
     • **Groq** for Hinglish transcription
-    • **No files saved locally** - everything in memory
+    • **Media kept in temporary files** - nothing saved to your device
     • **Download individual files** from preview
     • **Private accounts** may not work
     """)
@@ -623,37 +695,24 @@ def render_sidebar():
 
 def create_download_zip(result: Dict[str, Any]) -> bytes:
     """Create a zip file from the downloaded content."""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        file_contents = result.get("file_contents", {})
-        
-        # Add video
-        if 'video' in file_contents:
-            zip_file.writestr("video.mp4", file_contents['video'])
-        
-        # Add thumbnail
-        if 'thumbnail' in file_contents:
-            zip_file.writestr("thumbnail.jpg", file_contents['thumbnail'])
-        
-        # Add audio
-        if 'audio' in file_contents:
-            zip_file.writestr("audio.mp3", file_contents['audio'])
-        
-        # Add caption
-        if 'caption_text' in file_contents:
-            zip_file.writestr("caption.txt", file_contents['caption_text'])
-        
-        # Add transcript
-        if 'transcript_text' in file_contents:
-            zip_file.writestr("transcript.txt", file_contents['transcript_text'])
-        
-        # Add AI prompts if available
-        if 'ai_prompts_json' in file_contents:
-            zip_file.writestr("ai_video_prompts.json", file_contents['ai_prompts_json'])
+    file_contents = result.get("file_contents", {})
     
-    zip_buffer.seek(0)
-    return zip_buffer.getvalue()
+    # Video, thumbnail and audio, followed by the caption, transcript and AI prompts
+    media = [
+        (file_contents[key], arcname)
+        for key, _, arcname in PREVIEW_MEDIA
+        if key in file_contents
+    ]
+    texts = [
+        (arcname, file_contents[key])
+        for key, arcname in (
+            ("caption_text", "caption.txt"),
+            ("transcript_text", "transcript.txt"),
+            ("ai_prompts_json", "ai_video_prompts.json"),
+        )
+        if key in file_contents
+    ]
+    return build_zip(media, texts)
 
 
 def generate_ai_video_prompts(script: str, prompt_type: str, cameo_usernames: List[str], groq_api_key: str, progress_callback=None) -> Dict[str, Any]:
@@ -898,11 +957,11 @@ def display_media_preview(result: Dict[str, Any]):
                 st.subheader("🖼️ Thumbnail Preview")
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
-                    st.image(io.BytesIO(file_contents['thumbnail']), caption="Thumbnail", use_column_width=True)
+                    st.image(file_contents['thumbnail'], caption="Thumbnail", use_column_width=True)
                 
                 st.download_button(
                     label="📥 Download Thumbnail",
-                    data=file_contents['thumbnail'],
+                    data=Path(file_contents['thumbnail']).read_bytes(),
                     file_name="thumbnail.jpg",
                     mime="image/jpeg"
                 )
@@ -912,11 +971,11 @@ def display_media_preview(result: Dict[str, Any]):
         if 'video' in file_contents:
             with tabs[tab_index]:
                 st.subheader("📹 Video Preview")
-                st.video(io.BytesIO(file_contents['video']))
+                st.video(file_contents['video'])
                 
                 st.download_button(
                     label="📥 Download Video",
-                    data=file_contents['video'],
+                    data=Path(file_contents['video']).read_bytes(),
                     file_name="video.mp4",
                     mime="video/mp4"
                 )
@@ -926,11 +985,11 @@ def display_media_preview(result: Dict[str, Any]):
         if 'audio' in file_contents:
             with tabs[tab_index]:
                 st.subheader("🎵 Audio Preview")
-                st.audio(io.BytesIO(file_contents['audio']))
+                st.audio(file_contents['audio'])
                 
                 st.download_button(
                     label="📥 Download Audio",
-                    data=file_contents['audio'],
+                    data=Path(file_contents['audio']).read_bytes(),
                     file_name="audio.mp3",
                     mime="audio/mpeg"
                 )
@@ -1404,13 +1463,7 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: gray; font-size: 0.8em;">
-        <p>Multi-Platform Media Downloader | No Local Storage | Built with Streamlit</p>
-        <p>⚠️ Please respect content creators' rights and platform terms of service</p>
-        <p>🔒 All content is processed in memory - nothing saved to disk</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 def handle_rapidapi_download(options):
@@ -2246,12 +2299,12 @@ def handle_standard_download(options):
         try:
             # Initialize downloader with Groq support if enabled and API key available
             if options.get("transcribe") and options.get("use_groq") and options.get("groq_api_key"):
-                downloader = PreviewDownloader(
+                downloader = get_downloader(
                     groq_api_key=options.get("groq_api_key"),
                     use_groq=True
                 )
             else:
-                downloader = PreviewDownloader(use_groq=False)
+                downloader = get_downloader(use_groq=False)
             
             # Progress callback
             def update_progress(message):
@@ -2259,7 +2312,8 @@ def handle_standard_download(options):
             
             # Start preview
             with st.spinner("Loading content..."):
-                result = downloader.download_for_preview(
+                result = cached_preview(
+                    downloader,
                     url_input.strip(), 
                     options, 
                     progress_callback=update_progress
@@ -2355,9 +2409,9 @@ def handle_standard_download(options):
     st.markdown("---")
     st.markdown("""
     <div style="text-align: center; color: gray; font-size: 0.8em;">
-        <p>Instagram Media Previewer | No Local Storage | Built with Streamlit</p>
+        <p>Instagram Media Previewer | Temporary Storage Only | Built with Streamlit</p>
         <p>⚠️ Please respect content creators' rights and Instagram's terms of service</p>
-        <p>🔒 All content is processed in memory - nothing saved to disk</p>
+        <p>🔒 Previewed media is kept in temporary files on the server, not in your downloads</p>
     </div>
     """, unsafe_allow_html=True)
 
@@ -0,0 +1,198 @@
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch, MagicMock
+
+from src.utils import bin_checker
+
+
+def _mock_response(chunks):
+    """Builds a mock streamed response yielding the given chunks."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {"content-length": str(sum(len(c) for c in chunks))}
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+class TestDownloadFile(unittest.TestCase):
+    """Tests for the streamed file download helper."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dest_path = os.path.join(self.temp_dir.name, "file.bin")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writes_all_chunks(self):
+        """Test that every chunk is written to the destination file."""
+        chunks = [b"a" * 10, b"b" * 10]
+        with patch.object(
+            bin_checker._SESSION, "get", return_value=_mock_response(chunks)
+        ):
+            bin_checker.download_file("https://example.com/f", self.dest_path)
+
+        with open(self.dest_path, "rb") as f:
+            self.assertEqual(f.read(), b"".join(chunks))
+
+    def test_reports_scaled_progress_once_per_value(self):
+        """Test that progress is scaled and not repeated for the same value."""
+        chunks = [b"a" * 50, b"", b"b" * 50]
+        reported = []
+        with patch.object(
+            bin_checker._SESSION, "get", return_value=_mock_response(chunks)
+        ):
+            bin_checker.download_file(
+                "https://example.com/f",
+                self.dest_path,
+                lambda value, text: reported.append(value),
+                "Downloading...",
+                scale=50,
+            )
+
+        self.assertEqual(reported, [25, 50])
+
+    def test_accepts_matching_sha256(self):
+        """Test that a download whose digest matches is kept."""
+        chunks = [b"a" * 10, b"b" * 10]
+        digest = hashlib.sha256(b"".join(chunks)).hexdigest()
+        with patch.object(
+            bin_checker._SESSION, "get", return_value=_mock_response(chunks)
+        ):
+            bin_checker.download_file(
+                "https://example.com/f", self.dest_path, sha256=digest
+            )
+
+        self.assertTrue(os.path.exists(self.dest_path))
+
+    def test_removes_file_on_sha256_mismatch(self):
+        """Test that a download with the wrong digest is removed."""
+        with patch.object(
+            bin_checker._SESSION, "get", return_value=_mock_response([b"data"])
+        ):
+            with self.assertRaises(IOError):
+                bin_checker.download_file(
+                    "https://example.com/f", self.dest_path, sha256="0" * 64
+                )
+
+        self.assertFalse(os.path.exists(self.dest_path))
+        self.assertFalse(os.path.exists(self.dest_path + ".part"))
+
+    def test_interrupted_download_leaves_no_file(self):
+        """Test that a failed download does not leave a partial file behind."""
+        response = _mock_response([b"data"])
+        response.iter_content.side_effect = ConnectionError("reset")
+        with patch.object(bin_checker._SESSION, "get", return_value=response):
+            with self.assertRaises(ConnectionError):
+                bin_checker.download_file("https://example.com/f", self.dest_path)
+
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+class TestDownloadFfmpeg(unittest.TestCase):
+    """Tests for the in-memory FFmpeg download and extraction."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _zip_bytes(self, members):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            for name, data in members.items():
+                zf.writestr(name, data)
+        return buffer.getvalue()
+
+    def _download(self, members):
+        response = _mock_response([self._zip_bytes(members)])
+        with patch.object(
+            bin_checker, "BIN_DIR", self.temp_dir.name
+        ), patch.object(bin_checker._SESSION, "get", return_value=response):
+            return bin_checker.download_ffmpeg()
+
+    def test_extracts_only_ffmpeg_exe(self):
+        """Test that only ffmpeg.exe is written to the bin directory."""
+        result = self._download(
+            {
+                "ffmpeg-build/bin/ffmpeg.exe": b"exe",
+                "ffmpeg-build/bin/ffprobe.exe": b"probe",
+            }
+        )
+
+        self.assertTrue(result)
+        self.assertEqual(os.listdir(self.temp_dir.name), ["ffmpeg.exe"])
+        with open(os.path.join(self.temp_dir.name, "ffmpeg.exe"), "rb") as f:
+            self.assertEqual(f.read(), b"exe")
+
+    def test_failed_extraction_leaves_no_binary(self):
+        """Test that an interrupted extraction leaves neither ffmpeg.exe nor a .part file."""
+        with patch.object(bin_checker.shutil, "copyfileobj", side_effect=OSError("disk full")):
+            result = self._download({"ffmpeg-build/bin/ffmpeg.exe": b"exe"})
+
+        self.assertFalse(result)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_fails_when_archive_has_no_ffmpeg(self):
+        """Test that an archive without ffmpeg.exe is reported as a failure."""
+        self.assertFalse(self._download({"ffmpeg-build/README.txt": b"readme"}))
+
+
+class TestEnsureAllBinaries(unittest.TestCase):
+    """Tests for the concurrent dependency check."""
+
+    def test_runs_only_selected_checks(self):
+        """Test that only the requested dependencies are checked."""
+        with patch.object(
+            bin_checker, "ensure_yt_dlp", return_value=True
+        ) as mock_yt_dlp, patch.object(
+            bin_checker, "ensure_ffmpeg", return_value=True
+        ) as mock_ffmpeg, patch.object(
+            bin_checker, "ensure_whisper_model", return_value=True
+        ) as mock_whisper:
+            self.assertTrue(
+                bin_checker.ensure_all_binaries(yt_dlp=False, ffmpeg=False)
+            )
+            mock_yt_dlp.assert_not_called()
+            mock_ffmpeg.assert_not_called()
+            mock_whisper.assert_called_once()
+
+    def test_fails_if_any_check_fails(self):
+        """Test that a single failed download fails the whole check."""
+        with patch.object(
+            bin_checker, "ensure_yt_dlp", return_value=True
+        ), patch.object(
+            bin_checker, "ensure_ffmpeg", return_value=False
+        ), patch.object(
+            bin_checker, "ensure_whisper_model", return_value=True
+        ):
+            self.assertFalse(bin_checker.ensure_all_binaries())
+
+    def test_progress_is_aggregated_and_monotonic(self):
+        """Test that progress from all tasks is averaged and never decreases."""
+        reported = []
+
+        def fake_download(progress_callback=None):
+            progress_callback(60, "downloading")
+            progress_callback(20, "extracting")
+            progress_callback(100, "done")
+            return True
+
+        with patch.object(
+            bin_checker, "ensure_yt_dlp", side_effect=fake_download
+        ), patch.object(bin_checker, "ensure_ffmpeg", side_effect=fake_download):
+            bin_checker.ensure_all_binaries(
+                lambda value, text: reported.append(value), whisper=False
+            )
+
+        self.assertEqual(reported, sorted(reported))
+        self.assertEqual(reported[-1], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
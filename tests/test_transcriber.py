@@ -0,0 +1,106 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from src.core import transcriber
+from src.core.transcriber import AudioTranscriber
+
+
+class TestFasterWhisperBackend(unittest.TestCase):
+    """Tests for the optional faster-whisper transcription backend."""
+
+    def test_prefers_faster_whisper_when_installed(self):
+        """Test that faster-whisper is loaded with INT8 on the CPU."""
+        whisper_model_class = MagicMock()
+        with patch.object(transcriber, "is_frozen", return_value=False), patch.object(
+            transcriber, "lazy_import_faster_whisper", return_value=whisper_model_class
+        ), patch.object(transcriber, "_whisper_device", return_value="cpu"):
+            audio_transcriber = AudioTranscriber()
+            audio_transcriber.load_whisper_model()
+
+        self.assertTrue(audio_transcriber.uses_faster_whisper)
+        whisper_model_class.assert_called_once_with(
+            "base", device="cpu", compute_type="int8"
+        )
+
+    def test_wraps_model_in_batched_pipeline(self):
+        """Test that the model is batched and transcribed with a batch size."""
+        whisper_model_class = MagicMock()
+        pipeline_class = MagicMock()
+        pipeline_class.return_value.transcribe.return_value = (iter([]), None)
+        with patch.object(transcriber, "is_frozen", return_value=False), patch.object(
+            transcriber, "lazy_import_faster_whisper", return_value=whisper_model_class
+        ), patch.object(
+            transcriber, "lazy_import_faster_whisper_batched", return_value=pipeline_class
+        ), patch.object(transcriber, "_whisper_device", return_value="cpu"):
+            audio_transcriber = AudioTranscriber()
+            audio_transcriber.load_whisper_model()
+
+        pipeline_class.assert_called_once_with(model=whisper_model_class.return_value)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audio_transcriber._transcribe_with_faster_whisper(
+                "audio.mp3", Path(temp_dir) / "transcript1.txt"
+            )
+        pipeline_class.return_value.transcribe.assert_called_once_with(
+            "audio.mp3",
+            beam_size=5,
+            vad_filter=True,
+            batch_size=transcriber.FASTER_WHISPER_BATCH_SIZE,
+        )
+
+    def test_writes_segments_as_they_arrive(self):
+        """Test that segment texts are joined and written to the transcript."""
+        audio_transcriber = AudioTranscriber()
+        audio_transcriber.whisper_model = MagicMock()
+        audio_transcriber.whisper_model.transcribe.return_value = (
+            iter([MagicMock(text=" Hello", end=1.0), MagicMock(text=" world", end=2.0)]),
+            None,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            transcript_path = Path(temp_dir) / "transcript1.txt"
+            text = audio_transcriber._transcribe_with_faster_whisper(
+                "audio.mp3", transcript_path
+            )
+
+            self.assertEqual(text, " Hello world")
+            self.assertEqual(transcript_path.read_text(encoding="utf-8"), " Hello world")
+
+
+class TestWhisperAudioInput(unittest.TestCase):
+    """Tests for preparing openai-whisper input on the model's device."""
+
+    def test_passes_path_through_on_cpu(self):
+        """Test that CPU models receive the file path unchanged."""
+        audio_transcriber = AudioTranscriber()
+        audio_transcriber.whisper_model = MagicMock()
+        audio_transcriber.whisper_model.device.type = "cpu"
+
+        self.assertEqual(
+            audio_transcriber._whisper_audio_input("audio.mp3"), "audio.mp3"
+        )
+
+    def test_moves_samples_to_cuda(self):
+        """Test that CUDA models receive decoded samples on their device."""
+        audio_transcriber = AudioTranscriber()
+        audio_transcriber.whisper_model = MagicMock()
+        device = audio_transcriber.whisper_model.device
+        device.type = "cuda"
+        fake_torch = MagicMock()
+        load_audio = MagicMock(return_value="samples")
+
+        with patch.dict(sys.modules, {"torch": fake_torch}), patch.object(
+            transcriber, "lazy_import_whisper_audio", return_value=load_audio
+        ):
+            audio_input = audio_transcriber._whisper_audio_input("audio.mp3")
+
+        load_audio.assert_called_once_with("audio.mp3")
+        fake_torch.from_numpy.assert_called_once_with("samples")
+        fake_torch.from_numpy.return_value.to.assert_called_once_with(device)
+        self.assertIs(audio_input, fake_torch.from_numpy.return_value.to.return_value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from src import updater
+
+
+class TestGetLatestVersion(unittest.TestCase):
+    """Tests for the cached GitHub release lookup."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.temp_dir.name) / "update_cache.json"
+        patcher = patch.object(updater, "UPDATE_CACHE_FILE", self.cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_cache(self, entry):
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump({updater.LATEST_RELEASE_URL: entry}, f)
+
+    def test_fresh_cache_skips_request(self):
+        """Test that a cache younger than the TTL avoids the network."""
+        self._write_cache(
+            {"etag": '"abc"', "tag_name": "2024.12.23", "checked_at": time.time()}
+        )
+        with patch.object(updater._SESSION, "get") as mock_get:
+            self.assertEqual(updater.get_latest_version(), "2024.12.23")
+            mock_get.assert_not_called()
+
+    def test_not_modified_returns_cached_tag(self):
+        """Test that a 304 response reuses the cached tag."""
+        self._write_cache({"etag": '"abc"', "tag_name": "2024.12.23", "checked_at": 0})
+        response = MagicMock(status_code=304)
+        with patch.object(
+            updater._SESSION, "get", return_value=response
+        ) as mock_get:
+            self.assertEqual(updater.get_latest_version(), "2024.12.23")
+            self.assertEqual(
+                mock_get.call_args.kwargs["headers"], {"If-None-Match": '"abc"'}
+            )
+
+    def test_new_release_updates_cache(self):
+        """Test that a 200 response stores the new tag and ETag."""
+        response = MagicMock(status_code=200, headers={"ETag": '"def"'})
+        response.json.return_value = {"tag_name": "2025.01.01"}
+        with patch.object(
+            updater, "_get_asset_last_modified", return_value=None
+        ), patch.object(updater._SESSION, "get", return_value=response):
+            self.assertEqual(updater.get_latest_version(), "2025.01.01")
+
+        with open(self.cache_file, "r", encoding="utf-8") as f:
+            entry = json.load(f)[updater.LATEST_RELEASE_URL]
+        self.assertEqual(entry["tag_name"], "2025.01.01")
+        self.assertEqual(entry["etag"], '"def"')
+
+    def test_unchanged_last_modified_skips_api_request(self):
+        """Test that a matching asset Last-Modified avoids the API request."""
+        last_modified = "Mon, 23 Dec 2024 00:00:00 GMT"
+        self._write_cache(
+            {
+                "etag": None,
+                "last_modified": last_modified,
+                "tag_name": "2024.12.23",
+                "checked_at": 0,
+            }
+        )
+        with patch.object(
+            updater, "_get_asset_last_modified", return_value=last_modified
+        ), patch.object(updater._SESSION, "get") as mock_get:
+            self.assertEqual(updater.get_latest_version(), "2024.12.23")
+            mock_get.assert_not_called()
+
+
+class TestIsNewerVersion(unittest.TestCase):
+    """Tests for comparing yt-dlp version strings."""
+
+    def test_date_versions(self):
+        """Test ordinary date-based versions."""
+        self.assertTrue(updater.is_newer_version("2024.12.13", "2024.12.23"))
+        self.assertFalse(updater.is_newer_version("2024.12.23", "2024.12.23"))
+
+    def test_patch_suffix(self):
+        """Test that a patch suffix is newer than the plain release."""
+        self.assertTrue(updater.is_newer_version("2024.12.23", "2024.12.23.1"))
+        self.assertTrue(updater.is_newer_version("2024.9.1", "2024.10.1"))
+
+    def test_v_prefix(self):
+        """Test that a leading 'v' on one side is ignored."""
+        self.assertFalse(updater.is_newer_version("2024.12.23", "v2024.12.23"))
+
+    def test_invalid_versions_fall_back_to_strings(self):
+        """Test that unparseable versions are compared as strings."""
+        self.assertTrue(updater.is_newer_version("abc", "abd"))
+
+
+class TestGetCurrentVersion(unittest.TestCase):
+    """Tests for the cached yt-dlp --version lookup."""
+
+    def setUp(self):
+        patcher = patch.object(updater, "_current_version_cache", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuses_version_until_binary_changes(self):
+        """Test that the process only runs again after the mtime changes."""
+        result = MagicMock(stdout="2024.12.23\n")
+        with patch(
+            "src.updater.os.path.getmtime", side_effect=[1.0, 1.0, 2.0]
+        ), patch("src.updater.subprocess.run", return_value=result) as mock_run:
+            self.assertEqual(updater.get_current_version(), "2024.12.23")
+            self.assertEqual(updater.get_current_version(), "2024.12.23")
+            self.assertEqual(mock_run.call_count, 1)
+            updater.get_current_version()
+            self.assertEqual(mock_run.call_count, 2)
+
+    def test_missing_binary_returns_none(self):
+        """Test that a missing executable is reported without spawning it."""
+        with patch(
+            "src.updater.os.path.getmtime", side_effect=FileNotFoundError
+        ), patch("src.updater.subprocess.run") as mock_run:
+            self.assertIsNone(updater.get_current_version())
+            mock_run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,6 +40,15 @@ class TestURLValidator(unittest.TestCase):
         self.assertFalse(is_valid_instagram_url("https://malicious.com/reel/Cxyz123/"))
         self.assertFalse(is_valid_instagram_url("https://instagram.net/reel/Cxyz123/"))
 
+    def test_lookalike_hosts(self):
+        """Test hosts that only start with the Instagram domain."""
+        self.assertFalse(
+            is_valid_instagram_url("https://www.instagram.com.evil.com/reel/Cxyz123/")
+        )
+        self.assertFalse(
+            is_valid_instagram_url("https://www.instagram.com@evil.com/reel/Cxyz123/")
+        )
+
     def test_non_reel_post_urls(self):
         """Test non-reel/post Instagram URLs."""
         self.assertFalse(is_valid_instagram_url("https://www.instagram.com/"))
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import io
+import unittest
+import zipfile
+
+from src.utils.zip_utils import build_zip, iter_files
+
+
+class TestIterFiles(unittest.TestCase):
+    """Tests for the recursive file walker used to build download packages."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, relpath, data=b"data"):
+        path = os.path.join(self.root, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_yields_files_in_subdirectories(self):
+        """Test that files in nested directories are yielded."""
+        top = self._write("caption.txt")
+        nested = self._write(os.path.join("sub", "video.mp4"))
+        self.assertEqual(sorted(iter_files(self.root)), sorted([top, nested]))
+
+    def test_skips_empty_files(self):
+        """Test that 0-byte files are left out."""
+        kept = self._write("video.mp4")
+        self._write("video.mp4.lock", b"")
+        self.assertEqual(list(iter_files(self.root)), [kept])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks not supported")
+    def test_does_not_follow_symlinks(self):
+        """Test that symlinked files and directories are not followed."""
+        outside = tempfile.TemporaryDirectory()
+        self.addCleanup(outside.cleanup)
+        target = os.path.join(outside.name, "secret.txt")
+        with open(target, "wb") as f:
+            f.write(b"secret")
+        try:
+            os.symlink(target, os.path.join(self.root, "link.txt"))
+            os.symlink(outside.name, os.path.join(self.root, "linkdir"))
+        except OSError:
+            self.skipTest("cannot create symlinks")
+        self.assertEqual(list(iter_files(self.root)), [])
+
+
+class TestBuildZip(unittest.TestCase):
+    """Tests for the shared download-package builder."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, data):
+        path = os.path.join(self.root, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_media_is_stored_and_text_is_deflated(self):
+        """Test that compressed media is stored and other entries are deflated."""
+        video = self._write("Video.MP4", b"\x00" * 4096)
+        caption = self._write("caption.txt", b"caption " * 512)
+        data = build_zip(
+            [(video, "post/video.mp4"), (caption, "post/caption.txt")],
+            [("transcript.txt", "hello " * 512)],
+        )
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+            infos = {info.filename: info for info in zip_file.infolist()}
+            self.assertEqual(
+                sorted(infos), ["post/caption.txt", "post/video.mp4", "transcript.txt"]
+            )
+            self.assertEqual(infos["post/video.mp4"].compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(infos["post/caption.txt"].compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(infos["transcript.txt"].compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zip_file.read("post/video.mp4"), b"\x00" * 4096)
+            self.assertEqual(zip_file.read("transcript.txt"), b"hello " * 512)
+
+    def test_empty_archive(self):
+        """Test that an archive with no entries is still a valid ZIP file."""
+        with zipfile.ZipFile(io.BytesIO(build_zip(()))) as zip_file:
+            self.assertEqual(zip_file.namelist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()